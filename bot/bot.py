@@ -1,3 +1,5 @@
+import aiohttp
+import asyncio
 import discord
 import os
 import sys
@@ -51,12 +53,44 @@ class DarkBot(commands.AutoShardedBot):
         self.conn = get_connection()
         self.cursor = self.conn.cursor()
 
+        # Shared HTTP session, created once the event loop is running in setup_hook
+        self.http_session = None
+
+    async def setup_hook(self):
+        self.http_session = aiohttp.ClientSession(
+            # Per-host cap keeps a burst of commands from stampeding one API into 429s
+            connector=aiohttp.TCPConnector(limit=50, limit_per_host=10, ttl_dns_cache=300),
+            # One default for every request; a call that needs longer can pass its own timeout=
+            timeout=aiohttp.ClientTimeout(total=15, connect=5),
+        )
+
+        # Register every cog once, before the gateway connects. on_ready fires
+        # again after each reconnect, which re-ran these loads for nothing.
+        # Load each cog on its own so one with a missing dependency is skipped
+        # at registration time instead of aborting every cog after it.
+        for cog in cogs:
+            try:
+                await self.load_extension(f"cogs.{cog}")
+                logger.info("Cog loaded: %s", cog)
+            except Exception as e:
+                logger.info("Could not load extension %s: %s", cog, e)
+
+        logger.info("Loaded commands:")
+        for command in self.commands:
+            logger.info(command)
+
+    async def close(self):
+        # Cogs unload and in-flight commands finish during super().close(), so the session goes last
+        await super().close()
+        if self.http_session:
+            await self.http_session.close()
+
     async def on_connect(self):
         os.system("clear")
         # DB STUFF
-        self.cursor.execute("SELECT version();")
+        await asyncio.to_thread(self.cursor.execute, "SELECT version();")
         record = self.cursor.fetchone()
-        logger.info(f"Connected to - {record}")
+        logger.info("Connected to - %s", record)
         logger.info("DarkBot is starting up...")
 
     # async def on_message(self, message):
@@ -70,17 +104,6 @@ class DarkBot(commands.AutoShardedBot):
         await self.change_presence(activity=activity)
         os.system("clear")
 
-        try:
-            for cog in cogs:
-                logger.info(f"Cog loaded: {cog}")
-                await self.load_extension(f"cogs.{cog}")
-        except Exception as e:
-            logger.info(f"Could not load extension {e}")
-
-        logger.info("Loaded commands:")
-        for command in self.commands:
-            logger.info(command)
-
         logger.info(
             f"{self.console_info_format} ---------------DarkBot---------------------"
             f"\n{self.console_info_format} Bot is online and connected to {self.user}"
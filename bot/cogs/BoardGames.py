@@ -2,8 +2,7 @@ import re
 import os
 import discord
 from discord.ext import commands
-import aiohttp
-import asyncio  # testing
+import asyncio
 import xml.etree.ElementTree as ET
 
 from utils import boardgames as bg_utils
@@ -40,7 +39,7 @@ async def send_paginated_embeds(ctx, games, title, color):
             color=color,
         )
         await ctx.send(embed=embed)
-        logger.info(f"Sent page {i+1} of {len(pages)} for {title}")
+        logger.info("Sent page %s of %s for %s", i + 1, len(pages), title)
 
 
 class BoardGames(commands.Cog):
@@ -49,6 +48,14 @@ class BoardGames(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    def _fetch_owned_count(self):
+        """Blocking psycopg2 query, run in a worker thread by boardgame_count."""
+        with self.bot.conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(DISTINCT Name) FROM BoardGames WHERE own = true;"
+            )
+            return cursor.fetchone()
+
     @commands.command(aliases=["bgcount"])
     async def boardgame_count(self, ctx):
         """Check how many boardgames are in the DB."""
@@ -60,23 +67,19 @@ class BoardGames(commands.Cog):
                 )
                 return
 
-            with self.bot.conn.cursor() as cursor:
-                cursor.execute(
-                    "SELECT COUNT(DISTINCT Name) FROM BoardGames WHERE own = true;"
-                )
-                record = cursor.fetchone()
+            record = await asyncio.to_thread(self._fetch_owned_count)
 
             if record:
                 await ctx.send(
                     f"There are: {record[0]} unique board games owned by users in the Database."
                 )
-                logger.info(f"Successfully retrieved boardgame count: {record[0]}")
+                logger.info("Successfully retrieved boardgame count: %s", record[0])
             else:
                 await ctx.send("Unable to fetch database record.")
                 logger.error("Failed to fetch boardgame count from the database.")
         except Exception as e:
             await ctx.send(f"Error checking the database: {e}")
-            logger.error(f"Error checking the database: {e}")
+            logger.error("Error checking the database: %s", e)
 
     @commands.command(
         name="bgsearch",
@@ -86,53 +89,53 @@ class BoardGames(commands.Cog):
     async def search_boardgame(self, ctx, *, search_query: str):
         """Search for a board game on BoardGameGeek. Returns the top 5 results with names and object IDs."""
         search_url = f"{self.BASE_URL}search?search={search_query}"
-        logger.info(f"Searching for board games with query: {search_query}")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(search_url) as response:
-                if response.status == 200:
-                    xml_data = await response.text()
-                    root = ET.fromstring(xml_data)
-
-                    games = []
-                    for item in root.findall("boardgame")[
-                        :5
-                    ]:  # Limit to the first 5 results
-                        game_name = (
-                            item.find("name").text
-                            if item.find("name") is not None
-                            else "Unknown"
-                        )
-                        object_id = item.get("objectid")
-                        games.append(f"{game_name} (ID: {object_id})")
-
-                    if games:
-                        # Create an embed for the search results
-                        embed = discord.Embed(
-                            color=self.bot.embed_color,
-                            title=f"Top 5 search results for '{search_query}'",
-                            description="",
+        logger.info("Searching for board games with query: %s", search_query)
+
+        async with self.bot.http_session.get(search_url) as response:
+            if response.status == 200:
+                xml_data = await response.text()
+                root = ET.fromstring(xml_data)
+
+                games = []
+                for item in root.findall("boardgame")[
+                    :5
+                ]:  # Limit to the first 5 results
+                    game_name = (
+                        item.find("name").text
+                        if item.find("name") is not None
+                        else "Unknown"
+                    )
+                    object_id = item.get("objectid")
+                    games.append(f"{game_name} (ID: {object_id})")
+
+                if games:
+                    # Create an embed for the search results
+                    embed = discord.Embed(
+                        color=self.bot.embed_color,
+                        title=f"Top 5 search results for '{search_query}'",
+                        description="",
+                    )
+                    for game in games:
+                        # Since embed fields can't be empty, we use a zero-width space as placeholder if needed
+                        embed.add_field(
+                            name=game.split(" (ID: ")[0],
+                            value=f"ID: {game.split(' (ID: ')[1][:-1]}",
+                            inline=False,
                         )
-                        for game in games:
-                            # Since embed fields can't be empty, we use a zero-width space as placeholder if needed
-                            embed.add_field(
-                                name=game.split(" (ID: ")[0],
-                                value=f"ID: {game.split(' (ID: ')[1][:-1]}",
-                                inline=False,
-                            )
 
-                        await ctx.send(embed=embed)
-                        logger.info("Search completed successfully.")
-                    else:
-                        message = "No games found."
-                        logger.warning("Search completed but found no games.")
-                        await ctx.send(message)
+                    await ctx.send(embed=embed)
+                    logger.info("Search completed successfully.")
                 else:
-                    message = "Failed to retrieve search results."
+                    message = "No games found."
+                    logger.warning("Search completed but found no games.")
                     await ctx.send(message)
-                    logger.error(
-                        f"Failed to retrieve search results from the API with status code {response.status}."
-                    )
+            else:
+                message = "Failed to retrieve search results."
+                await ctx.send(message)
+                logger.error(
+                    "Failed to retrieve search results from the API with status code %s.",
+                    response.status,
+                )
 
     @commands.command(
         name="bginfo",
@@ -141,80 +144,81 @@ class BoardGames(commands.Cog):
     )
     async def boardgame_info(self, ctx, game_id: str):
         """Fetch information for a board game by its BoardGameGeek ID, including ratings and recommended player count."""
-        logger.info(f"Fetching info for game ID: {game_id}")
+        logger.info("Fetching info for game ID: %s", game_id)
         info_url = f"{self.BASE_URL}boardgame/{game_id}?stats=1"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(info_url) as response:
-                if response.status == 200:
-                    xml_data = await response.text()
-                    root = ET.fromstring(xml_data)
-
-                    game = root.find("boardgame")
-                    if game is not None:
-                        game_name = "Unknown"
-                        for name in game.findall("name"):
-                            if name.get("primary") == "true":
-                                game_name = name.text
-                                logger.info(f"Game found: {game_name} (ID: {game_id})")
-                                break
-
-                        age = (
-                            game.find("age").text
-                            if game.find("age") is not None
-                            else "N/A"
-                        )
+        async with self.bot.http_session.get(info_url) as response:
+            if response.status == 200:
+                xml_data = await response.text()
+                root = ET.fromstring(xml_data)
+
+                game = root.find("boardgame")
+                if game is not None:
+                    game_name = "Unknown"
+                    for name in game.findall("name"):
+                        if name.get("primary") == "true":
+                            game_name = name.text
+                            logger.info("Game found: %s (ID: %s)", game_name, game_id)
+                            break
+
+                    age = (
+                        game.find("age").text
+                        if game.find("age") is not None
+                        else "N/A"
+                    )
 
-                        poll = game.find("poll[@name='suggested_numplayers']")
-                        best_count = "N/A"
-                        max_best_votes = -1
-                        if poll is not None:
-                            for results in poll.findall("results"):
-                                numplayers = results.get("numplayers")
-                                best_votes = int(
-                                    results.find("result[@value='Best']").get(
-                                        "numvotes"
-                                    )
+                    poll = game.find("poll[@name='suggested_numplayers']")
+                    best_count = "N/A"
+                    max_best_votes = -1
+                    if poll is not None:
+                        for results in poll.findall("results"):
+                            numplayers = results.get("numplayers")
+                            best_votes = int(
+                                results.find("result[@value='Best']").get(
+                                    "numvotes"
                                 )
-                                if best_votes > max_best_votes:
-                                    max_best_votes = best_votes
-                                    best_count = numplayers
-
-                        ratings = game.find("statistics/ratings")
-                        users_rated = (
-                            ratings.find("usersrated").text
-                            if ratings.find("usersrated") is not None
-                            else "N/A"
-                        )
-                        average_rating = (
-                            ratings.find("average").text
-                            if ratings.find("average") is not None
-                            else "N/A"
-                        )
-                        if average_rating != "N/A":
-                            average_rating = "{:.2f}".format(float(average_rating))
-
-                        embed = discord.Embed(
-                            color=self.bot.embed_color,
-                            title=f"**{game_name}**",
-                            description=(
-                                f"**ID:** {game_id}\n"
-                                f"**Recommended Age:** {age}+\n"
-                                f"**Recommended Player Count:** {best_count}\n"
-                                f"**Users Rated:** {users_rated}\n"
-                                f"**Average Rating:** {average_rating}\n"
-                            ),
-                        )
-                        await ctx.send(embed=embed)
-                    else:
-                        message = "Game not found."
-                        await ctx.send(message)
-                        logger.warning(f"Game ID {game_id} not found.")
-                else:
-                    await ctx.send("Failed to retrieve game information.")
-                    logger.error(
-                        f"Failed to retrieve game information for ID {game_id} with status code {response.status}."
+                            )
+                            if best_votes > max_best_votes:
+                                max_best_votes = best_votes
+                                best_count = numplayers
+
+                    ratings = game.find("statistics/ratings")
+                    users_rated = (
+                        ratings.find("usersrated").text
+                        if ratings.find("usersrated") is not None
+                        else "N/A"
+                    )
+                    average_rating = (
+                        ratings.find("average").text
+                        if ratings.find("average") is not None
+                        else "N/A"
                     )
+                    if average_rating != "N/A":
+                        average_rating = "{:.2f}".format(float(average_rating))
+
+                    embed = discord.Embed(
+                        color=self.bot.embed_color,
+                        title=f"**{game_name}**",
+                        description=(
+                            f"**ID:** {game_id}\n"
+                            f"**Recommended Age:** {age}+\n"
+                            f"**Recommended Player Count:** {best_count}\n"
+                            f"**Users Rated:** {users_rated}\n"
+                            f"**Average Rating:** {average_rating}\n"
+                        ),
+                    )
+                    await ctx.send(embed=embed)
+                else:
+                    message = "Game not found."
+                    await ctx.send(message)
+                    logger.warning("Game ID %s not found.", game_id)
+            else:
+                await ctx.send("Failed to retrieve game information.")
+                logger.error(
+                    "Failed to retrieve game information for ID %s with status code %s.",
+                    game_id,
+                    response.status,
+                )
 
     @commands.command(
         name="bggcollection",
@@ -224,11 +228,10 @@ class BoardGames(commands.Cog):
     async def bgg_collection(self, ctx, username: str):
         """Fetches and displays a user's board game collection from BoardGameGeek including additional game statistics."""
         collection_url = f"{self.BASE_URL}collection/{username}?own=1&stats=1"
-        logger.info(f"Starting collection fetch for BGG username: {username}")
+        logger.info("Starting collection fetch for BGG username: %s", username)
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                response = await session.get(collection_url)
+        try:
+            async with self.bot.http_session.get(collection_url) as response:
                 if response.status == 200:
                     xml_data = await response.text()
                     root = ET.fromstring(xml_data)
@@ -264,24 +267,27 @@ class BoardGames(commands.Cog):
                         f"{username}'s Board Game Collection",
                         self.bot.embed_color,
                     )
-                    logger.info(f"Successfully displayed collection for {username}")
+                    logger.info("Successfully displayed collection for %s", username)
                 elif response.status == 202:
                     await ctx.send(
                         f"Collection data for {username} is being prepared, please wait a few moments."
                     )
                     logger.warning(
-                        f"Data preparation in progress for {username}, response stats 202"
+                        "Data preparation in progress for %s, response stats 202",
+                        username,
                     )
                 else:
                     logger.error(
-                        f"Failed to retrieve collection with status code {response.status} for {username}"
+                        "Failed to retrieve collection with status code %s for %s",
+                        response.status,
+                        username,
                     )
                     await ctx.send("Failed to retrieve collection.")
-            except Exception as e:
-                logger.exception(
-                    f"An error occurred while fetching collection for {username}: {str(e)}"
-                )
-                await ctx.send("An error occurred while processing your request.")
+        except Exception as e:
+            logger.exception(
+                "An error occurred while fetching collection for %s: %s", username, e
+            )
+            await ctx.send("An error occurred while processing your request.")
 
     @commands.command(
         name="manualbggupdate",
@@ -292,11 +298,11 @@ class BoardGames(commands.Cog):
         """This command starts the manual update process for BGG collections."""
         await ctx.send("Starting manual update of BGG collections. Please wait...")
         try:
-            res = await bg_utils.process_bgg_users()
+            res = await bg_utils.process_bgg_users(self.bot.http_session)
             await ctx.send("BGG collections updated successfully.")
         except Exception as e:
             await ctx.send(f"Failed to update BGG collections: {str(e)}")
-            logger.error(f"Failed to update BGG collections: {str(e)}")
+            logger.error("Failed to update BGG collections: %s", e)
 
 
 async def setup(client):
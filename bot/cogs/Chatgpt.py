@@ -17,7 +17,7 @@ class ChatGPT(commands.Cog):
     @commands.command(name="askgpt", help="Ask ChatGPT a question and get a response.")
     async def askgpt(self, ctx, *, question: str):
         """Handles the command for asking ChatGPT a question."""
-        logger.info(f"User {ctx.author} asked: {question}")
+        logger.info("User %s asked: %s", ctx.author, question)
 
         try:
             # Make a request to the OpenAI API
@@ -33,7 +33,7 @@ class ChatGPT(commands.Cog):
             await ctx.send(answer)
 
         except Exception as e:
-            logger.error(f"Error occurred while processing ChatGPT request: {e}")
+            logger.error("Error occurred while processing ChatGPT request: %s", e)
             await ctx.send(
                 "Sorry, I couldn't process your request. Please try again later."
             )
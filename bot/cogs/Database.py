@@ -1,3 +1,5 @@
+import asyncio
+
 import discord
 from discord.ext import commands
 from db import get_connection
@@ -8,22 +10,46 @@ class Database(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    async def close_db(self, conn, cursor):
-        """Utility function to close database connection and cursor."""
-        if cursor:
-            cursor.close()
-        if conn:
+    def _run_query(self, query, params=None, fetch=None, commit=False):
+        """Blocking query on its own connection; the commands run it in a worker thread.
+
+        fetch is "all", "one" or None; returns the fetched rows, if any.
+        """
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(query, params)
+                if fetch == "all":
+                    result = cursor.fetchall()
+                elif fetch == "one":
+                    result = cursor.fetchone()
+                else:
+                    result = None
+            if commit:
+                conn.commit()
+            return result
+        finally:
+            conn.close()
+
+    def _execute_raw(self, query):
+        """Blocking execute_sql query; returns its rows, or commits and returns None."""
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                if cursor.description:  # If there is something to fetch
+                    return cursor.fetchall()
+            conn.commit()
+            return None
+        finally:
             conn.close()
 
     @commands.command(name="listusers", help="Lists all users from the database.")
     async def list_users(self, ctx):
-        conn = None
-        cursor = None
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM get_enabled_users();")
-            users = cursor.fetchall()
+            users = await asyncio.to_thread(
+                self._run_query, "SELECT * FROM get_enabled_users();", fetch="all"
+            )
 
             if not users:
                 await ctx.send("No users found.")
@@ -45,9 +71,7 @@ class Database(commands.Cog):
             logger.info("Successfully listed all users.")
         except Exception as e:
             await ctx.send("Failed to fetch users.")
-            logger.error(f"Failed to fetch users: {e}")
-        finally:
-            await self.close_db(conn, cursor)
+            logger.error("Failed to fetch users: %s", e)
 
     @commands.command(
         name="adduser",
@@ -61,18 +85,15 @@ class Database(commands.Cog):
         bgg_user: str,
         is_enabled: bool = True,
     ):
-        conn = None
-        cursor = None
         try:
             discord_user_int = int(discord_user)
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
+            result = await asyncio.to_thread(
+                self._run_query,
                 "SELECT upsert_user(%s, %s, %s, %s)",
                 (name, discord_user_int, bgg_user, is_enabled),
+                fetch="one",
+                commit=True,
             )
-            result = cursor.fetchone()
-            conn.commit()
 
             embed = discord.Embed(
                 color=self.bot.embed_color,
@@ -86,22 +107,17 @@ class Database(commands.Cog):
             logger.warning("Invalid input for Discord User ID.")
         except Exception as e:
             await ctx.send(f"An error occurred: {e}")
-            logger.error(f"An error occurred during user upsert: {e}")
-        finally:
-            await self.close_db(conn, cursor)
+            logger.error("An error occurred during user upsert: %s", e)
 
     @commands.command(
         name="disableuser",
         help="Disables a user by their ID. Usage: !disableuser <user_id>",
     )
     async def disable_user(self, ctx, user_id: int):
-        conn = None
-        cursor = None
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT disable_user(%s)", (user_id,))
-            conn.commit()
+            await asyncio.to_thread(
+                self._run_query, "SELECT disable_user(%s)", (user_id,), commit=True
+            )
 
             embed = discord.Embed(
                 color=self.bot.embed_color,
@@ -109,26 +125,20 @@ class Database(commands.Cog):
                 description=f"The user with ID {user_id} has been disabled.",
             )
             await ctx.send(embed=embed)
-            logger.info(f"User with ID {user_id} disabled successfully.")
+            logger.info("User with ID %s disabled successfully.", user_id)
         except Exception as e:
             await ctx.send(f"Failed to disable user: {e}")
-            logger.error(f"Failed to disable user: {e}")
-        finally:
-            await self.close_db(conn, cursor)
+            logger.error("Failed to disable user: %s", e)
 
     @commands.command(
         name="enableuser",
         help="Enables a user by their ID. Usage: !enableuser <user_id>",
     )
     async def enable_user(self, ctx, user_id: int):
-        conn = None
-        cursor = None
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT enable_user(%s)", (user_id,))
-            result = cursor.fetchone()[0]
-            conn.commit()
+            await asyncio.to_thread(
+                self._run_query, "SELECT enable_user(%s)", (user_id,), commit=True
+            )
 
             embed = discord.Embed(
                 color=self.bot.embed_color,
@@ -138,8 +148,6 @@ class Database(commands.Cog):
             await ctx.send(embed=embed)
         except Exception as e:
             await ctx.send(f"Failed to enable user: {e}")
-        finally:
-            await self.close_db(conn, cursor)
 
     def chunk_games(self, games, size=25):
         """Yield successive chunks from games."""
@@ -153,42 +161,43 @@ class Database(commands.Cog):
     async def list_board_games(self, ctx, letter: str, username: str = None):
         if len(letter) != 1 or not letter.isalpha():
             await ctx.send("Please provide a single alphabetical letter.")
-            logger.warning(f"Invalid input for list_board_games command: '{letter}'")
+            logger.warning("Invalid input for list_board_games command: '%s'", letter)
             return
 
-        conn = None
-        cursor = None
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-
             if username:
                 logger.debug(
-                    f"Executing database query for games starting with '{letter}' owned by '{username}'."
+                    "Executing database query for games starting with '%s' owned by '%s'.",
+                    letter,
+                    username,
                 )
-                cursor.execute(
+                games = await asyncio.to_thread(
+                    self._run_query,
                     "SELECT * FROM get_boardgames_starting_with_and_owned_by(%s, %s)",
                     (letter, username),
+                    fetch="all",
                 )
             else:
                 logger.debug(
-                    f"Executing database query for games starting with '{letter}'."
+                    "Executing database query for games starting with '%s'.", letter
                 )
-                cursor.execute(
-                    "SELECT * FROM get_boardgames_starting_with(%s)", (letter,)
+                games = await asyncio.to_thread(
+                    self._run_query,
+                    "SELECT * FROM get_boardgames_starting_with(%s)",
+                    (letter,),
+                    fetch="all",
                 )
 
-            games = cursor.fetchall()
             total_games = len(games)
-            logger.info(f"Number of games fetched: {total_games}")
+            logger.info("Number of games fetched: %s", total_games)
 
             if not games:
                 await ctx.send(f"No board games found starting with '{letter}'.")
-                logger.info(f"No board games found for letter: {letter}")
+                logger.info("No board games found for letter: %s", letter)
                 return
 
             game_chunks = list(self.chunk_games(games))
-            logger.debug(f"Number of chunks created: {len(game_chunks)}")
+            logger.debug("Number of chunks created: %s", len(game_chunks))
 
             game_count = 0  # Counter for the number of games listed so far
             for chunk in game_chunks:
@@ -206,20 +215,17 @@ class Database(commands.Cog):
                     game_count += 1  # Increment the counter for each game listed
                 await ctx.send(embed=embed)
                 logger.info(
-                    f"Embed sent for a chunk of games starting with '{letter}'. {game_count} games listed so far."
+                    "Embed sent for a chunk of games starting with '%s'. %s games listed so far.",
+                    letter,
+                    game_count,
                 )
         except Exception as e:
             await ctx.send(f"Failed to fetch board games: {e}")
             logger.error(
-                f"Exception occurred while fetching games starting with '{letter}': {e}"
+                "Exception occurred while fetching games starting with '%s': %s",
+                letter,
+                e,
             )
-        finally:
-            if cursor:
-                cursor.close()
-                logger.debug("Database cursor closed.")
-            if conn:
-                conn.close()
-                logger.debug("Database connection closed.")
 
     @commands.command(
         name="executesql", help="Executes a custom SQL query. Owner only."
@@ -233,17 +239,10 @@ class Database(commands.Cog):
             await ctx.send("This command does not support destructive operations.")
             return
 
-        conn = None
-        cursor = None
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
+            results = await asyncio.to_thread(self._execute_raw, query)
 
-            # Parameterized query execution
-            cursor.execute(query)
-
-            if cursor.description:  # If there is something to fetch
-                results = cursor.fetchall()
+            if results is not None:
                 message = "\n".join([str(result) for result in results])
                 if (
                     len(message) > 1900
@@ -251,18 +250,12 @@ class Database(commands.Cog):
                     message = message[:1900] + "..."
                 await ctx.send(f"Query executed successfully:\n{message}")
             else:
-                conn.commit()
                 await ctx.send("Query executed successfully with no return.")
 
-            logger.info(f"SQL executed by owner: {query}")
+            logger.info("SQL executed by owner: %s", query)
         except Exception as e:
             await ctx.send(f"Failed to execute query: {e}")
-            logger.error(f"Exception occurred during SQL execution: {e}")
-        finally:
-            if cursor:
-                cursor.close()
-            if conn:
-                conn.close()
+            logger.error("Exception occurred during SQL execution: %s", e)
 
     async def send_paginated_embeds(self, ctx, games):
         per_page = 5
@@ -24,11 +24,11 @@ class Events(commands.Cog):
         # else:
         #     pass
 
-        logger.info(f"Events | Joined Guild: {guild.name} | ID: {guild.id}")
+        logger.info("Events | Joined Guild: %s | ID: %s", guild.name, guild.id)
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild):
-        logger.info(f"Events | Left Guild: {guild.name} | ID: {guild.id}")
+        logger.info("Events | Left Guild: %s | ID: %s", guild.name, guild.id)
 
 
 async def setup(bot):
@@ -8,11 +8,19 @@ from discord.ext import commands
 from datetime import datetime, timedelta
 from logging_files.information_logging import logger
 
+STATUSES = {
+    "online": discord.Status.online,
+    "idle": discord.Status.idle,
+    "dnd": discord.Status.dnd,
+    "offline": discord.Status.offline,
+}
+
 
 class Information(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.bot_start_time = time.time()
+        # Monotonic so NTP or manual clock changes can't skew the bot uptime
+        self.bot_start_time = time.monotonic()
 
     @commands.command(aliases=["commands", "cmds"])
     async def robot_commands(self, ctx):
@@ -34,7 +42,7 @@ class Information(commands.Cog):
             print(ctx.channel.permissions_for(ctx.author))
             await ctx.send(embed=embed)
 
-            logger.info(f"Information | Sent Commands: {ctx.author}")
+            logger.info("Information | Sent Commands: %s", ctx.author)
         except Exception as e:
             print(f"There was an error: {e}")
 
@@ -111,7 +119,7 @@ class Information(commands.Cog):
 
             await ctx.send(embed=embed)
 
-            logger.info(f"Information | Sent stats: {ctx.author}")
+            logger.info("Information | Sent stats: %s", ctx.author)
         except Exception as e:
             print(f"There was an error: {e}")
 
@@ -127,7 +135,7 @@ class Information(commands.Cog):
 
         await ctx.author.send(embed=embed)
 
-        logger.info(f"Information | Sent Invite: {ctx.author}")
+        logger.info("Information | Sent Invite: %s", ctx.author)
 
     @commands.command()
     async def ping(self, ctx):
@@ -148,18 +156,19 @@ class Information(commands.Cog):
         embed.add_field(name="• REST:", value=f"{int(ping)}ms")
         await ctx.send(embed=embed)
 
-        logger.info(f"Information | Sent Ping: {ctx.author}")
+        logger.info("Information | Sent Ping: %s", ctx.author)
 
     @commands.command()
     async def uptime(self, ctx):
         """Command to check the bot's and system's uptime."""
         try:
             # Bot Uptime
-            current_time = time.time()
-            bot_difference = int(round(current_time - self.bot_start_time))
+            bot_difference = int(round(time.monotonic() - self.bot_start_time))
             bot_uptime_duration = str(timedelta(seconds=bot_difference))
 
             # System Uptime
+            # psutil reports boot time as a wall-clock timestamp
+            current_time = time.time()
             boot_time_timestamp = psutil.boot_time()
             boot_time = datetime.fromtimestamp(boot_time_timestamp)
             system_uptime_duration = str(
@@ -183,7 +192,7 @@ class Information(commands.Cog):
 
             await ctx.send(embed=embed)
 
-            logger.info(f"Information | Uptime checked: {ctx.author}")
+            logger.info("Information | Uptime checked: %s", ctx.author)
         except Exception as e:
             print(f"There was an error: {e}")
 
@@ -249,7 +258,7 @@ class Information(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Information | Sent Whois: {ctx.author}")
+        logger.info("Information | Sent Whois: %s", ctx.author)
 
     @whois.error
     async def whois_error(self, ctx, error):
@@ -270,25 +279,21 @@ class Information(commands.Cog):
 
     @commands.command()
     async def status(self, ctx, online_status):
-        if str(online_status).lower() == "dnd":
-            await self.bot.change_presence(status=discord.Status.dnd)
-        elif str(online_status).lower() == "idle":
-            await self.bot.change_presence(status=discord.Status.idle)
-        elif str(online_status).lower() == "offline":
-            await self.bot.change_presence(status=discord.Status.offline)
-        else:
-            await self.bot.change_presence(status=discord.Status.online)
+        online_status = online_status.lower()
+        await self.bot.change_presence(
+            status=STATUSES.get(online_status, discord.Status.online)
+        )
 
         embed = discord.Embed(
             color=self.bot.embed_color,
             title="→ Online Status Changed!",
-            description=f"• My status has been updated to: `{online_status.lower()}`",
+            description=f"• My status has been updated to: `{online_status}`",
         )
 
         await ctx.send(embed=embed)
 
         logger.info(
-            f"Owner | Sent Status: {ctx.author} | Online Status: {online_status}"
+            "Owner | Sent Status: %s | Online Status: %s", ctx.author, online_status
         )
 
     @status.error
@@ -314,7 +319,7 @@ class Information(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Owner | Sent Name: {ctx.author} | Name: {name}")
+        logger.info("Owner | Sent Name: %s | Name: %s", ctx.author, name)
 
     @name.error
     async def name_error(self, ctx, error):
@@ -1,109 +1,160 @@
-import traceback
+import asyncio
+import copy
+from datetime import timedelta
 
 import discord
 from discord.ext import commands
 
 from logging_files.moderation_logging import logger
 
+# Shared error replies, checked in order with isinstance. The BadArgument and
+# MissingRequiredArgument replies carry each command's own usage text.
+ERROR_MESSAGES = (
+    (commands.MissingPermissions, "→ Missing Permissions", "• You do not have permissions to run this command!"),
+    (commands.BotMissingPermissions, "→ Bot Missing Permissions!", "• Please give me permissions to use this command!"),
+)
+
+
+class Snowflake(commands.Converter):
+    """Accepts a raw Discord ID and returns it wrapped as a discord.Object."""
+
+    async def convert(self, ctx, argument):
+        # Rejects malformed IDs before they reach the ban/unban API call
+        if not argument.isdigit() or not 17 <= len(argument) <= 20:
+            raise commands.BadArgument(f"{argument} is not a valid Discord ID.")
+        return discord.Object(int(argument))
+
 
 class Moderation(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        # Position of the bot's top role per guild id, dropped on any role or bot member change.
+        self._bot_top_positions = {}
+
+        # Replies that never change are built once and sent as-is; command replies
+        # start from a shallow copy of their titled shell and only set the description.
+        self._bot_outranked_embed = discord.Embed(
+            color=self.bot.embed_color,
+            title="→ User Information",
+            description="• The user has higher permissions than me!"
+        )
+        self._author_outranked_embed = discord.Embed(
+            color=self.bot.embed_color,
+            title="→ User Information",
+            description="• The user has higher permissions than you or equal permissions!"
+        )
+        self._command_embeds = {
+            "add_role": discord.Embed(color=self.bot.embed_color, title="• Add Role Command!"),
+            "ban": discord.Embed(color=self.bot.embed_color, title="• Ban command"),
+            "kick": discord.Embed(color=self.bot.embed_color, title="• Kick Command"),
+            "remove_role": discord.Embed(color=self.bot.embed_color, title="• Remove Role Command"),
+            "warn": discord.Embed(color=self.bot.embed_color, title="• Warn Command"),
+        }
+
+    def _bot_top_position(self, guild):
+        position = self._bot_top_positions.get(guild.id)
+        if position is None:
+            position = self._bot_top_positions[guild.id] = guild.me.top_role.position
+        return position
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role):
+        self._bot_top_positions.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        self._bot_top_positions.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        self._bot_top_positions.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before, after):
+        if after.id == self.bot.user.id:
+            self._bot_top_positions.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._bot_top_positions.pop(guild.id, None)
+
+    async def _send_error(self, ctx, error, invalid, missing):
+        """Reply with the embed matching error; returns False if unhandled.
+
+        invalid is the (title, description) for a BadArgument, missing the
+        description for a MissingRequiredArgument.
+        """
+        # isinstance, so subclasses such as MemberNotFound still match
+        if isinstance(error, commands.BadArgument):
+            title, description = invalid
+        elif isinstance(error, commands.MissingRequiredArgument):
+            title, description = "→ Invalid Argument!", missing
+        else:
+            for error_type, title, description in ERROR_MESSAGES:
+                if isinstance(error, error_type):
+                    break
+            else:
+                return False
+
+        embed = discord.Embed(color=self.bot.embed_color, title=title, description=description)
+        await ctx.send(embed=embed)
+        return True
+
+    async def _reply_and_dm(self, ctx, member, embed, dm_embed):
+        """Send the channel reply and the member's DM together; a closed DM must not drop the reply."""
+        reply, dm = await asyncio.gather(ctx.send(embed=embed), member.send(embed=dm_embed), return_exceptions=True)
+        if isinstance(reply, Exception):
+            logger.error("Moderation | Reply failed in: %s", ctx.channel, exc_info=reply)
+        # Forbidden just means the member doesn't accept DMs from the bot
+        if isinstance(dm, Exception) and not isinstance(dm, discord.Forbidden):
+            logger.error("Moderation | DM failed to: %s", member, exc_info=dm)
 
     @commands.command(aliases=["addrole"])
     @commands.has_permissions(manage_roles=True)
     @commands.bot_has_permissions(manage_roles=True)
     async def add_role(self, ctx, role: discord.Role, member: discord.Member,):
-        if ctx.guild.me.top_role < member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than me!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.author.top_role <= member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than you or equal permissions!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.guild.me.top_role > member.top_role:
+        bot_position = self._bot_top_position(ctx.guild)
+        member_position = member.top_role.position
+        # The bot can only act on members strictly below its own top role
+        if bot_position <= member_position:
+            await ctx.send(embed=self._bot_outranked_embed)
+        elif ctx.author.top_role.position <= member_position:
+            await ctx.send(embed=self._author_outranked_embed)
+        else:
             await member.add_roles(role)
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="• Add Role Command!",
-                description=f"{member.mention} → Has been given the role `{role}`"
-            )
+            embed = copy.copy(self._command_embeds["add_role"])
+            embed.description = f"{member.mention} → Has been given the role `{role}`"
 
             await ctx.send(embed=embed)
 
-            logger.info(f"Moderation | Sent Addrole: {ctx.author} | Role added: {role} | To: {member}")
-        else:
-            traceback.print_exc()
+            logger.info("Moderation | Sent Addrole: %s | Role added: %s | To: %s", ctx.author, role, member)
 
     @add_role.error
     async def add_role_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Role / Member!",
-                description="• Please select a valid role / member! Example: `!addrole <role ID / rolename> @user`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `!addrole <Role ID / Rolename> @user`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Missing Permissions",
-                description="• You do not have permissions to run this command!"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Bot Missing Permissions!",
-                description="• Please give me permissions to use this command!"
-            )
-            await ctx.send(embed=embed)
+        await self._send_error(
+            ctx, error,
+            ("→ Invalid Role / Member!", "• Please select a valid role / member! Example: `!addrole <role ID / rolename> @user`"),
+            "• Please put a valid option! Example: `!addrole <Role ID / Rolename> @user`"
+        )
 
     @commands.command()
     @commands.has_permissions(ban_members=True)
     @commands.bot_has_permissions(ban_members=True)
     async def ban(self, ctx, member: discord.Member, *, reason="No reason provided!"):
-        if ctx.guild.me.top_role < member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than me!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.author.top_role <= member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than you or equal permissions!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.guild.me.top_role > member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="• Ban command",
-                description=f"{member.mention} → has been **Banned!** Bye bye! :wave:"
-            )
+        bot_position = self._bot_top_position(ctx.guild)
+        member_position = member.top_role.position
+        if bot_position <= member_position:
+            await ctx.send(embed=self._bot_outranked_embed)
+        elif ctx.author.top_role.position <= member_position:
+            await ctx.send(embed=self._author_outranked_embed)
+        else:
+            embed = copy.copy(self._command_embeds["ban"])
+            embed.description = f"{member.mention} → has been **Banned!** Bye bye! :wave:"
 
             sender = ctx.author
             await member.ban(reason=reason)
 
-            await ctx.send(embed=embed)
-
             embed2 = discord.Embed(
                 color=self.bot.embed_color,
                 title=f"{member} → You Have Been Banned!"
@@ -112,117 +163,57 @@ class Moderation(commands.Cog):
             embed2.add_field(name="• Reason", value=f"{reason}")
             embed2.set_footer(text=f"Banned from: {ctx.guild}")
 
-            await member.send(embed=embed2)
+            await self._reply_and_dm(ctx, member, embed, embed2)
 
-            logger.info(f"Moderation | Sent Ban: {ctx.author} | Banned: {member} | Reason: {reason}")
-        else:
-            traceback.print_exc()
+            logger.info("Moderation | Sent Ban: %s | Banned: %s | Reason: %s", ctx.author, member, reason)
 
     @ban.error
     async def ban_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Member!",
-                description="• Please mention a valid member! Example: `!ban @user [reason]`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `!ban @user [reason]`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Missing Permissions",
-                description="• You do not have permissions to run this command!"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Bot Missing Permissions!",
-                description="• Please give me permissions to use this command!"
-            )
-            await ctx.send(embed=embed)
+        await self._send_error(
+            ctx, error,
+            ("→ Invalid Member!", "• Please mention a valid member! Example: `!ban @user [reason]`"),
+            "• Please put a valid option! Example: `!ban @user [reason]`"
+        )
+
     @commands.command()
     @commands.has_permissions(ban_members=True)
     @commands.bot_has_permissions(ban_members=True)
-    async def forceban(self, ctx, *, id: int):
-        await ctx.guild.ban(discord.Object(id))
+    async def forceban(self, ctx, *, user: Snowflake):
+        await ctx.guild.ban(user)
         embed = discord.Embed(
             color=self.bot.embed_color,
             title="• Forceban Command",
-            description=f"<@{id}> → has been **Forcefully banned!** Bye bye! :wave:"
+            description=f"<@{user.id}> → has been **Forcefully banned!** Bye bye! :wave:"
         )
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Moderation | Sent Force Ban: {ctx.author} | Force Banned: {id}")
+        logger.info("Moderation | Sent Force Ban: %s | Force Banned: %s", ctx.author, user.id)
 
     @forceban.error
     async def forceban_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid ID!",
-                description="• Please use a valid Discord ID! Example: `l!forceban <ID>`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid argument! Example: `l!forceban <ID>`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Missing Permissions",
-                description="• You do not have permissions to run this command!"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Bot Missing Permissions!",
-                description="• Please give me permissions to use this command!"
-            )
-            await ctx.send(embed=embed)
+        await self._send_error(
+            ctx, error,
+            ("→ Invalid ID!", "• Please use a valid Discord ID! Example: `l!forceban <ID>`"),
+            "• Please put a valid argument! Example: `l!forceban <ID>`"
+        )
 
     @commands.command(pass_context=True)
     @commands.has_permissions(kick_members=True)
     @commands.bot_has_permissions(kick_members=True)
     async def kick(self, ctx, member: discord.Member, *, reason="No reason provided!"):
-        if ctx.guild.me.top_role < member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than me!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.author.top_role <= member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than you or equal permissions!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.guild.me.top_role > member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="• Kick Command",
-                description=f"{member.mention} → has been **kicked!** Bye bye! :wave:"
-            )
+        bot_position = self._bot_top_position(ctx.guild)
+        member_position = member.top_role.position
+        if bot_position <= member_position:
+            await ctx.send(embed=self._bot_outranked_embed)
+        elif ctx.author.top_role.position <= member_position:
+            await ctx.send(embed=self._author_outranked_embed)
+        else:
+            embed = copy.copy(self._command_embeds["kick"])
+            embed.description = f"{member.mention} → has been **kicked!** Bye bye! :wave:"
             sender = ctx.author
             await member.kick(reason=reason)
 
-            await ctx.send(embed=embed)
-
             embed2 = discord.Embed(
                 color=self.bot.embed_color,
                 title=f"{member} → You have been kicked!"
@@ -231,212 +222,101 @@ class Moderation(commands.Cog):
             embed2.add_field(name="• Reason", value=f"{reason}")
             embed2.set_footer(text=f"Kicked from: {ctx.guild}")
 
-            await member.send(embed=embed2)
+            await self._reply_and_dm(ctx, member, embed, embed2)
 
-            logger.info(f"Moderation | Sent Kick: {ctx.author} | Kicked: {member} | Reason: {reason}")
-        else:
-            traceback.print_exc()
+            logger.info("Moderation | Sent Kick: %s | Kicked: %s | Reason: %s", ctx.author, member, reason)
 
     @kick.error
     async def kick_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Member!",
-                description="• Please mention a valid member! Example: `l!kick @user [reason]`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `l!kick @user [reason]`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Missing Permissions",
-                description="• You do not have permissions to run this command!"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Bot Missing Permissions!",
-                description="• Please give me permissions to use this command!"
-            )
-            await ctx.send(embed=embed)
-        else:
+        if not await self._send_error(
+            ctx, error,
+            ("→ Invalid Member!", "• Please mention a valid member! Example: `l!kick @user [reason]`"),
+            "• Please put a valid option! Example: `l!kick @user [reason]`"
+        ):
             raise error
 
     @commands.command()
     @commands.has_permissions(manage_messages=True)
     @commands.bot_has_permissions(manage_messages=True)
     async def purge(self, ctx, amount: int):
-        await ctx.channel.purge(limit=amount)
+        amount = max(1, min(amount, 1000))
+        # Discord only bulk deletes messages younger than 14 days; anything older
+        # falls back to one DELETE per message, so stay inside that window.
+        # purge() already splits the bulk deletes into batches of 100.
+        cutoff = discord.utils.utcnow() - timedelta(days=13, hours=23)
+        await ctx.channel.purge(limit=amount, bulk=True, after=cutoff, oldest_first=False)
 
-        logger.info(f"Moderation | Sent Purge: {ctx.author} | Purged: {amount} messages")
+        logger.info("Moderation | Sent Purge: %s | Purged: %s messages", ctx.author, amount)
 
     @purge.error
     async def purge_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Amount Of Messages!",
-                description="• Please put a valid number! Example: `l!purge <number>`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `l!purge <number>`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Missing Permissions",
-                description="• You do not have permissions to run this command!"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Bot Missing Permissions!",
-                description="• Please give me permissions to use this command!"
-            )
-            await ctx.send(embed=embed)
+        await self._send_error(
+            ctx, error,
+            ("→ Invalid Amount Of Messages!", "• Please put a valid number! Example: `l!purge <number>`"),
+            "• Please put a valid option! Example: `l!purge <number>`"
+        )
 
     @commands.command(aliases=["removerole", "delrole"])
     @commands.has_permissions(manage_roles=True)
     @commands.bot_has_permissions(manage_roles=True)
     async def remove_role(self, ctx, role: discord.Role, member: discord.Member,):
-        if ctx.guild.me.top_role < member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than me!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.author.top_role <= member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than you or equal permissions!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.guild.me.top_role > member.top_role:
+        bot_position = self._bot_top_position(ctx.guild)
+        member_position = member.top_role.position
+        if bot_position <= member_position:
+            await ctx.send(embed=self._bot_outranked_embed)
+        elif ctx.author.top_role.position <= member_position:
+            await ctx.send(embed=self._author_outranked_embed)
+        else:
             await member.remove_roles(role)
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="• Remove Role Command",
-                description=f"{member.mention} → Lost the role `{role}`"
-            )
+            embed = copy.copy(self._command_embeds["remove_role"])
+            embed.description = f"{member.mention} → Lost the role `{role}`"
 
             await ctx.send(embed=embed)
 
-            logger.info(f"Moderation | Sent Remove Role: {ctx.author} | Removed Role: {role} | To: {member}")
-        else:
-            traceback.print_exc()
+            logger.info("Moderation | Sent Remove Role: %s | Removed Role: %s | To: %s", ctx.author, role, member)
 
     @remove_role.error
     async def remove_role_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Role / Member!",
-                description="• Please select a valid role / member! Example: `l!delrole <role ID / rolename> @user`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `l!delrole <Role ID / Rolename> @user`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Missing Permissions",
-                description="• You do not have permissions to run this command!"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Bot Missing Permissions!",
-                description="• Please give me permissions to use this command!"
-            )
-            await ctx.send(embed=embed)
+        await self._send_error(
+            ctx, error,
+            ("→ Invalid Role / Member!", "• Please select a valid role / member! Example: `l!delrole <role ID / rolename> @user`"),
+            "• Please put a valid option! Example: `l!delrole <Role ID / Rolename> @user`"
+        )
 
     @commands.command()
     @commands.has_permissions(ban_members=True)
     @commands.bot_has_permissions(ban_members=True)
-    async def unban(self, ctx, *, id: int):
-        await ctx.guild.unban(discord.Object(id))
+    async def unban(self, ctx, *, user: Snowflake):
+        await ctx.guild.unban(user)
         embed = discord.Embed(
             color=self.bot.embed_color,
             title="• Unban Command",
-            description=f"<@{id}> → has been **Unbanned!** Welcome back! :wave:"
+            description=f"<@{user.id}> → has been **Unbanned!** Welcome back! :wave:"
         )
         await ctx.send(embed=embed)
 
-        logger.info(f"Moderation | Sent Unban: {ctx.author} | Unbanned: {id}")
+        logger.info("Moderation | Sent Unban: %s | Unbanned: %s", ctx.author, user.id)
 
     @unban.error
     async def unban_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid ID!",
-                description="• Please use a valid Discord ID! Example: `l!unban <ID>`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid Discord ID! Example: `l!unban 546812331213062144`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Missing Permissions",
-                description="• You do not have permissions to run this command!"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Bot Missing Permissions!",
-                description="• Please give me permissions to use this command!"
-            )
-            await ctx.send(embed=embed)
+        await self._send_error(
+            ctx, error,
+            ("→ Invalid ID!", "• Please use a valid Discord ID! Example: `l!unban <ID>`"),
+            "• Please put a valid Discord ID! Example: `l!unban 546812331213062144`"
+        )
 
     @commands.command()
     @commands.has_permissions(manage_messages=True)
     @commands.bot_has_permissions(manage_messages=True)
     async def warn(self, ctx, member: discord.Member, *, reason="No reason provided!"):
-        if ctx.guild.me.top_role < member.top_role:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ User Information",
-                description="• The user has higher permissions than me!"
-            )
-            await ctx.send(embed=embed)
-        elif ctx.guild.me.top_role > member.top_role:
+        bot_position = self._bot_top_position(ctx.guild)
+        member_position = member.top_role.position
+        if bot_position <= member_position:
+            await ctx.send(embed=self._bot_outranked_embed)
+        else:
             sender = ctx.author
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="• Warn Command",
-                description=f"{member.mention} → has been **Warned!**"
-            )
-
-            await ctx.send(embed=embed)
+            embed = copy.copy(self._command_embeds["warn"])
+            embed.description = f"{member.mention} → has been **Warned!**"
 
             embed2 = discord.Embed(
                 color=self.bot.embed_color,
@@ -446,48 +326,22 @@ class Moderation(commands.Cog):
             embed2.add_field(name="• Reason", value=f"`{reason}`")
             embed2.set_footer(text=f"Warning sent from: {ctx.guild}")
 
-            await member.send(embed=embed2)
+            await self._reply_and_dm(ctx, member, embed, embed2)
 
-            logger.info(f"Moderation | Sent Warn: {ctx.author} | Warned: {member} | Reason: {reason}")
+            logger.info("Moderation | Sent Warn: %s | Warned: %s | Reason: %s", ctx.author, member, reason)
 
     @warn.error
     async def warn_error(self, ctx, error):
-        if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Member!",
-                description="• Please mention a valid member! Example: `!warn @user [reason]`"
-            )
-            await ctx.send(embed=embed)
-        if isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `!warn @user [reason]`"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.MissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Missing Permissions",
-                description="• You do not have permissions to run this command!"
-            )
-            await ctx.send(embed=embed)
-        elif isinstance(error, commands.BotMissingPermissions):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Bot Missing Permissions!",
-                description="• Please give me permissions to use this command!"
-            )
-            await ctx.send(embed=embed)
+        await self._send_error(
+            ctx, error,
+            ("→ Invalid Member!", "• Please mention a valid member! Example: `!warn @user [reason]`"),
+            "• Please put a valid option! Example: `!warn @user [reason]`"
+        )
 
     @commands.command()
     @commands.has_permissions(move_members=True)  # Ensure user has the right permissions
     async def dc_voice(self, ctx, member: discord.Member):
         """Disconnects a user from a voice channel."""
-        print(ctx.author.guild_permissions)
-        print(ctx.channel.permissions_for(ctx.author))
-
         if member.voice is None or member.voice.channel is None:
             await ctx.send(f"{member.mention} is not in a voice channel!")
             return
@@ -495,7 +349,7 @@ class Moderation(commands.Cog):
         await member.move_to(None)
         await ctx.send(f"Disconnected {member.mention} from their voice channel.")
 
-        logger.info(f"Moderation | Disconnected: {member} | By: {ctx.author}")
+        logger.info("Moderation | Disconnected: %s | By: %s", member, ctx.author)
 
 
 
@@ -1,35 +1,63 @@
-import requests
+import time
+from collections import OrderedDict
+
 import discord
 from discord.ext import commands
 from logging_files.mtg_logging import logger
 
+CARD_CACHE_SIZE = 256
+CARD_CACHE_TTL = 3600  # seconds
+
 
 class Mtg(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.api_base_url = "https://api.magicthegathering.io/v1"
+        self.cards_url = f"{self.api_base_url}/cards"
+        # Normalized card name -> (expires_at, card), least recently used first
+        self._card_cache = OrderedDict()
 
-    def fetch_card(self, card_name):
-        """Fetch card details by name."""
-        params = {
-            "name": card_name
-        }  # You can use additional parameters based on your requirement
-        response = requests.get(f"{self.api_base_url}/cards", params=params)
-        if response.status_code == 200:
-            return response.json().get("cards", [])[
-                0
-            ]  # Assuming the first card is the one you want
-        else:
-            logger.error(f"Failed to fetch card: {response.text}")
+    async def _get_cards(self, params):
+        """Query the cards endpoint. Returns the list of cards, or None on an API error."""
+        async with self.bot.http_session.get(self.cards_url, params=params) as response:
+            if response.status == 200:
+                return (await response.json()).get("cards", [])
+            logger.error("Failed to fetch cards: %s", await response.text())
             return None
 
+    async def fetch_card(self, card_name):
+        """Fetch card details by name, served from the in-memory cache when possible."""
+        key = " ".join(card_name.lower().split())
+        cached = self._card_cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._card_cache.move_to_end(key)
+                return cached[1]
+            del self._card_cache[key]
+
+        card = await self._fetch_card(card_name)
+        if card is not None:
+            self._card_cache[key] = (time.monotonic() + CARD_CACHE_TTL, card)
+            if len(self._card_cache) > CARD_CACHE_SIZE:
+                self._card_cache.popitem(last=False)
+        return card
+
+    async def _fetch_card(self, card_name):
+        """Fetch card details by name from the API."""
+        # Only the first match is shown, so don't pull a full page of printings
+        params = {"name": card_name, "pageSize": 1}
+        cards = await self._get_cards(params)
+        if not cards:
+            return None
+        return cards[0]  # Assuming the first card is the one you want
+
     @commands.command(
         name="card", help="Get details about a Magic: The Gathering card."
     )
     async def card(self, ctx, *, card_name):
         """A command that fetches and displays MTG card details."""
-        logger.info(f"Fetching card: {card_name}")
-        card_data = self.fetch_card(card_name)
+        logger.info("Fetching card: %s", card_name)
+        card_data = await self.fetch_card(card_name)
         if card_data:
             embed = discord.Embed(
                 title=card_data["name"],
@@ -51,35 +79,27 @@ class Mtg(commands.Cog):
     )
     async def search_cards(self, ctx, card_type: str, card_color: str):
         """Search for cards by a specific type and color."""
-        logger.info(f"Searching for cards: Type={card_type}, Color={card_color}")
+        logger.info("Searching for cards: Type=%s, Color=%s", card_type, card_color)
         params = {
             "types": card_type,
             "colors": card_color,
             "pageSize": 5,
         }  # Fetching only the top 5 results
-        response = requests.get(f"{self.api_base_url}/cards", params=params)
-        if response.status_code == 200:
-            cards = response.json().get("cards", [])
+        cards = await self._get_cards(params)
+
+        if cards is not None:
             if cards:
+                # One embed with a field per card instead of one message per card
+                embed = discord.Embed(title=f"Results for {card_type}/{card_color}")
                 for card in cards:
-                    embed = discord.Embed(
-                        title=card["name"],
-                        description=card.get("text", "No description available."),
-                    )
-                    embed.add_field(
-                        name="Mana Cost",
-                        value=card.get("manaCost", "N/A"),
-                        inline=False,
-                    )
-                    embed.add_field(
-                        name="Type", value=card.get("type", "N/A"), inline=False
-                    )
-                    embed.set_thumbnail(url=card.get("imageUrl", ""))
-                    await ctx.send(embed=embed)
+                    value = f"{card.get('type', 'N/A')} | {card.get('manaCost', 'N/A')}"
+                    if card.get("imageUrl"):
+                        value += f" | [Image]({card['imageUrl']})"
+                    embed.add_field(name=card["name"], value=value, inline=False)
+                await ctx.send(embed=embed)
             else:
                 await ctx.send("No cards found matching the criteria.")
         else:
-            logger.error(f"Failed to search for cards: {response.text}")
             await ctx.send("Failed to fetch card data.")
 
 
@@ -1,14 +1,36 @@
-import re
 import os
+import asyncio
 import discord
-import math
 import lavalink
+from functools import lru_cache
+from itertools import islice
 from discord.ext import commands
 from lavalink.filters import LowPass
 
-url_rx = re.compile(r'https?://(?:www\.)?.+')
-LAVALINK_PASS = os.getenv("LAVALINK_PASS")
-LAVALINK_SERVER = os.getenv("LAVALINK_SERVER")
+# Read once at import so a missing setting fails the cog load instead of connecting to "None".
+LAVALINK_PASS = os.environ["LAVALINK_PASS"]
+LAVALINK_SERVER = os.environ["LAVALINK_SERVER"]
+LAVALINK_PORT = int(os.getenv("LAVALINK_PORT") or 2333)
+
+
+def format_ms(ms):
+    """ Formats a duration in milliseconds as HH:MM:SS using integer arithmetic only. """
+    minutes, seconds = divmod(ms // 1000, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours:02}:{minutes:02}:{seconds:02}'
+
+
+@lru_cache(maxsize=256)
+def format_duration(ms):
+    """ Cached format_ms for track lengths, which never change for a given track. """
+    return format_ms(ms)
+
+
+def thumbnail_url(track):
+    """ Returns the thumbnail for a track, or None when its source doesn't provide one we can build. """
+    if track.source_name == 'youtube':
+        return f'https://img.youtube.com/vi/{track.identifier}/default.jpg'
+    return None
 
 
 class LavalinkVoiceClient(discord.VoiceClient):
@@ -22,19 +44,8 @@ class LavalinkVoiceClient(discord.VoiceClient):
     def __init__(self, client: discord.Client, channel: discord.abc.Connectable):
         self.client = client
         self.channel = channel
-        # ensure a client already exists
-        if hasattr(self.client, 'lavalink'):
-            self.lavalink = self.client.lavalink
-        else:
-            self.client.lavalink = lavalink.Client(client.user.id)
-            self.client.lavalink.add_node(
-                str(LAVALINK_SERVER),
-                2333,
-                str(LAVALINK_PASS),
-                'us',
-                'default-node'
-            )
-            self.lavalink = self.client.lavalink
+        # The Music cog creates the client when it loads, before any voice connection can exist.
+        self.lavalink = client.lavalink
 
     async def on_voice_server_update(self, data):
         # the data needs to be transformed before being handed down to
@@ -68,7 +79,14 @@ class LavalinkVoiceClient(discord.VoiceClient):
         Handles the disconnect.
         Cleans up running player and leaves the voice client.
         """
-        player = self.lavalink.player_manager.get(self.channel.guild.id)
+        guild_id = self.channel.guild.id
+        player = self.lavalink.player_manager.get(guild_id)
+
+        if player is None:
+            # The player is already gone from the cache, so only the voice connection is left to tear down.
+            await self.channel.guild.change_voice_state(channel=None)
+            self.cleanup()
+            return
 
         # no need to disconnect if we are not connected
         if not force and not player.is_connected:
@@ -81,16 +99,28 @@ class LavalinkVoiceClient(discord.VoiceClient):
         # this must be done because the on_voice_state_update that would set channel_id
         # to None doesn't get dispatched after the disconnect
         player.channel_id = None
+        # Drop the player from the manager's cache so dead players don't pile up.
+        await self.lavalink.player_manager.destroy(guild_id)
         self.cleanup()
 
 
 class Music(commands.Cog):
+    # Plain-text replies shared by the voice checks and commands below.
+    ERRORS = {
+        'no_voice': 'Join a voicechannel first.',
+        'not_connected': 'Not connected.',
+        'no_permissions': 'I need the `CONNECT` and `SPEAK` permissions.',
+        'wrong_channel': 'You need to be in my voicechannel.',
+        'not_my_channel': 'You\'re not in my voicechannel!',
+        'nothing_found': 'Nothing found!',
+    }
+
     def __init__(self, bot):
         self.bot = bot
 
         if not hasattr(bot, 'lavalink'):  # This ensures the client isn't overwritten during cog reloads.
             bot.lavalink = lavalink.Client(bot.user.id)
-            bot.lavalink.add_node('lavalink-app', 2333, 'Musicboy12?', 'us', 'default-node')  # Host, Port, Password, Region, Name
+            bot.lavalink.add_node(LAVALINK_SERVER, LAVALINK_PORT, LAVALINK_PASS, 'us', 'default-node')  # Host, Port, Password, Region, Name
 
         lavalink.add_event_hook(self.track_hook)
 
@@ -110,6 +140,10 @@ class Music(commands.Cog):
 
         return guild_check
 
+    async def _reply(self, ctx, title, description):
+        """ Sends the cog's standard single-embed reply. """
+        await ctx.send(embed=discord.Embed(color=self.bot.embed_color, title=title, description=description))
+
     async def cog_command_error(self, ctx, error):
         if isinstance(error, commands.CommandInvokeError):
             await ctx.send(error.original)
@@ -127,6 +161,9 @@ class Music(commands.Cog):
         # Most people might consider this a waste of resources for guilds that aren't playing, but this is
         # the easiest and simplest way of ensuring players are created.
 
+        # Hand the player to the command through the context so commands don't look it up again.
+        ctx.player = player
+
         # These are commands that require the bot to join a voicechannel (i.e. initiating playback).
         # Commands such as volume/skip etc don't require the bot to be in a voicechannel so don't need listing here.
         should_connect = ctx.command.name in ('play',)
@@ -135,23 +172,24 @@ class Music(commands.Cog):
             # Our cog_command_error handler catches this and sends it to the voicechannel.
             # Exceptions allow us to "short-circuit" command invocation via checks so the
             # execution state of the command goes no further.
-            raise commands.CommandInvokeError('Join a voicechannel first.')
+            raise commands.CommandInvokeError(self.ERRORS['no_voice'])
 
         v_client = ctx.voice_client
         if not v_client:
             if not should_connect:
-                raise commands.CommandInvokeError('Not connected.')
+                raise commands.CommandInvokeError(self.ERRORS['not_connected'])
 
             permissions = ctx.author.voice.channel.permissions_for(ctx.me)
 
             if not permissions.connect or not permissions.speak:  # Check user limit too?
-                raise commands.CommandInvokeError('I need the `CONNECT` and `SPEAK` permissions.')
+                raise commands.CommandInvokeError(self.ERRORS['no_permissions'])
 
             player.store('channel', ctx.channel.id)
-            await ctx.author.voice.channel.connect(cls=LavalinkVoiceClient)
+            # `play` awaits this together with its track search so both round trips overlap.
+            ctx.voice_connect = ctx.author.voice.channel.connect(cls=LavalinkVoiceClient)
         else:
             if v_client.channel.id != ctx.author.voice.channel.id:
-                raise commands.CommandInvokeError('You need to be in my voicechannel.')
+                raise commands.CommandInvokeError(self.ERRORS['wrong_channel'])
 
     async def track_hook(self, event):
         if isinstance(event, lavalink.events.QueueEndEvent):
@@ -165,23 +203,26 @@ class Music(commands.Cog):
     @commands.command(aliases=['p'])
     async def play(self, ctx, *, query: str):
         """ Searches and plays a song from a given query. """
-        # Get the player for this guild from cache.
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
+        player = ctx.player
         # Remove leading and trailing <>. <> may be used to suppress embedding links in Discord.
         query = query.strip('<>')
 
         # Check if the user input might be a URL. If it isn't, we can Lavalink do a YouTube search for it instead.
         # SoundCloud searching is possible by prefixing "scsearch:" instead.
-        if not url_rx.match(query):
+        if not query.startswith(('http://', 'https://')):
             query = f'ytsearch:{query}'
 
-        # Get the results for the query from Lavalink.
-        results = await player.node.get_tracks(query)
+        # Get the results for the query from Lavalink, joining the voice channel at the same time if needed.
+        connect = getattr(ctx, 'voice_connect', None)
+        if connect is None:
+            results = await player.node.get_tracks(query)
+        else:
+            results, _ = await asyncio.gather(player.node.get_tracks(query), connect)
 
         # Results could be None if Lavalink returns an invalid response (non-JSON/non-200 (OK)).
         # Alternatively, results.tracks could be an empty array if the query yielded no tracks.
         if not results or not results.tracks:
-            return await ctx.send('Nothing found!')
+            return await ctx.send(self.ERRORS['nothing_found'])
 
         embed = discord.Embed(color=discord.Color.blurple())
 
@@ -195,8 +236,12 @@ class Music(commands.Cog):
             tracks = results.tracks
 
             for track in tracks:
-                # Add all of the tracks from the playlist to the queue.
-                player.add(requester=ctx.author.id, track=track)
+                track.requester = ctx.author.id
+                track.extra['thumbnail'] = thumbnail_url(track)
+
+            # Add all of the tracks from the playlist to the queue in one go.
+            # This is what player.add() does per track for AudioTrack instances.
+            player.queue.extend(tracks)
 
             embed.title = 'Playlist Enqueued!'
             embed.description = f'{results.playlist_info.name} - {len(tracks)} tracks'
@@ -205,6 +250,7 @@ class Music(commands.Cog):
             embed.title = 'Track Enqueued'
             embed.description = f'[{track.title}]({track.uri})'
 
+            track.extra['thumbnail'] = thumbnail_url(track)
             player.add(requester=ctx.author.id, track=track)
              
 
@@ -219,8 +265,7 @@ class Music(commands.Cog):
     @commands.command(aliases=['lp'])
     async def lowpass(self, ctx, strength: float):
         """ Sets the strength of the low pass filter. """
-        # Get the player for this guild from cache.
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
+        player = ctx.player
 
         # This enforces that strength should be a minimum of 0.
         # There's no upper limit on this filter.
@@ -252,16 +297,16 @@ class Music(commands.Cog):
     @commands.command(aliases=['dc'])
     async def disconnect(self, ctx):
         """ Disconnects the player from the voice channel and clears its queue. """
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
+        player = ctx.player
 
         if not ctx.voice_client:
             # We can't disconnect, if we're not connected.
-            return await ctx.send('Not connected.')
+            return await ctx.send(self.ERRORS['not_connected'])
 
-        if not ctx.author.voice or (player.is_connected and ctx.author.voice.channel.id != int(player.channel_id)):
+        if not ctx.author.voice or (player.is_connected and ctx.author.voice.channel.id != player.channel_id):
             # Abuse prevention. Users not in voice channels, or not in the same voice channel as the bot
             # may not disconnect the bot.
-            return await ctx.send('You\'re not in my voicechannel!')
+            return await ctx.send(self.ERRORS['not_my_channel'])
 
         # Clear the queue to ensure old tracks don't start playing
         # when someone else queues something.
@@ -275,7 +320,7 @@ class Music(commands.Cog):
     @commands.command(aliases=['vol', 'v'])
     async def volume(self, ctx, volume: int=None):
         """ Changes the player's volume (0-100). """
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
+        player = ctx.player
 
         if not volume:
             return await ctx.send(f'🔊 | The current volume is: **{player.volume}%**')
@@ -286,57 +331,37 @@ class Music(commands.Cog):
     @commands.command(aliases=['s'])
     async def skip(self, ctx):
         """ Skips the current track. """
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
+        player = ctx.player
 
         await player.skip()
-        embed = discord.Embed(
-            color=self.bot.embed_color,
-            title="→ Skipped",
-            description="• The current song you have requested has been **skipped!**"
-        )
-        await ctx.send(embed=embed)
+        await self._reply(ctx, "→ Skipped", "• The current song you have requested has been **skipped!**")
 
     @commands.command()
     async def stop(self, ctx):
         """ Stops the player and clears its queue. """
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
+        player = ctx.player
 
         if not player.is_playing:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ No Songs!",
-                description="• Nothing is playing at the moment!"
-            )
-            return await ctx.send(embed=embed)
+            return await self._reply(ctx, "→ No Songs!", "• Nothing is playing at the moment!")
 
         player.queue.clear()
         await player.stop()
 
-        embed = discord.Embed(
-            color=self.bot.embed_color,
-            title="→ Stopped!",
-            description="• The music has been stopped!"
-        )
-        await ctx.send(embed=embed)
+        await self._reply(ctx, "→ Stopped!", "• The music has been stopped!")
 
     @commands.command(aliases=['np', 'n', 'playing'])
     async def now(self, ctx):
         """ Shows some stats about the currently playing song. """
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
+        player = ctx.player
 
         if not player.current:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ No Songs!",
-                description="• Nothing is playing at the moment!"
-            )
-            return await ctx.send(embed=embed)
+            return await self._reply(ctx, "→ No Songs!", "• Nothing is playing at the moment!")
 
-        position = lavalink.utils.format_time(player.position)
+        position = format_ms(int(player.position))
         if player.current.stream:
             duration = '🔴 Live Video'
         else:
-            duration = lavalink.utils.format_time(player.current.duration)
+            duration = format_duration(player.current.duration)
         song = f'**• [{player.current.title}]({player.current.uri})**'
 
         embed = discord.Embed(
@@ -345,70 +370,56 @@ class Music(commands.Cog):
             description=f"{song}"
                         f"\n**•** Current time: **({position}/{duration})**"
         )
-        embed.set_thumbnail(url=f'https://img.youtube.com/vi/{player.current.identifier}/default.jpg')
+        thumbnail = player.current.extra.get('thumbnail')
+        if thumbnail:
+            embed.set_thumbnail(url=thumbnail)
         await ctx.send(embed=embed)
 
     @commands.command(aliases=['q'])
     async def queue(self, ctx, page: int = 1):
         """ Shows the player's queue. """
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
-
-        if not player.queue:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ No Queue!",
-                description="• No songs are in the queue at the moment!"
-            )
-            return await ctx.send(embed=embed)
+        tracks = ctx.player.queue
+        queue_length = len(tracks)
+
+        if not queue_length:
+            return await self._reply(ctx, "→ No Queue!", "• No songs are in the queue at the moment!")
 
         items_per_page = 10
-        pages = math.ceil(len(player.queue) / items_per_page)
+        pages = -(-queue_length // items_per_page)
+        # islice rejects negative indices, so keep the page number in range.
+        page = max(1, page)
 
         start = (page - 1) * items_per_page
         end = start + items_per_page
 
-        queue_list = ''
-        for index, track in enumerate(player.queue[start:end], start=start):
-            queue_list += f'`{index + 1}.` [**{track.title}**]({track.uri})\n'
+        queue_list = ''.join(
+            f'`{index + 1}.` [**{track.title}**]({track.uri})\n'
+            for index, track in enumerate(islice(tracks, start, end), start=start)
+        )
 
         embed = discord.Embed(
             color=self.bot.embed_color,
             title="→ List Of Songs:",
             description=f"\n{queue_list}"
         )
-        # embed.set_author(name=f'→ List of songs: {len(player.queue)} \n\n{queue_list}')
+        # embed.set_author(name=f'→ List of songs: {queue_length} \n\n{queue_list}')
         embed.set_footer(text=f'• On page: {page}/{pages}')
         await ctx.send(embed=embed)
 
     @commands.command(aliases=['resume'])
     async def pause(self, ctx):
         """ Pauses/Resumes the current track. """
-        player = self.bot.lavalink.player_manager.get(ctx.guild.id)
+        player = ctx.player
 
         if not player.is_playing:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Not Playing!",
-                description="• No song is playing is currently playing!"
-            )
-            return await ctx.send(embed=embed)
+            return await self._reply(ctx, "→ Not Playing!", "• No song is playing is currently playing!")
 
         if player.paused:
             await player.set_pause(False)
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Resumed!",
-                description="• The current song has been **resumed successfully!**"
-            )
-            await ctx.send(embed=embed)
+            await self._reply(ctx, "→ Resumed!", "• The current song has been **resumed successfully!**")
         else:
             await player.set_pause(True)
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Paused!",
-                description="• The current song has been **paused successfully!**"
-            )
-            await ctx.send(embed=embed)
+            await self._reply(ctx, "→ Paused!", "• The current song has been **paused successfully!**")
 
 async def setup(bot):
     await bot.add_cog(Music(bot))
@@ -1,26 +1,64 @@
+import asyncio
 import random
 
 import discord
-import requests
 from discord.ext import commands
 
 from logging_files.owner_logging import logger
 
+# (bit, display name) for every permission flag, e.g. "manage_roles" -> "Manage Roles".
+# Built from Permissions.all() rather than VALID_FLAGS so aliases are not listed twice.
+PERMISSION_FLAGS = tuple(
+    (discord.Permissions.VALID_FLAGS[name], name.replace("_", " ").title())
+    for name, _ in discord.Permissions.all()
+)
+
 class Owner(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # Text channels per guild for get_invite, dropped whenever that guild's channels change.
+        self._text_channel_cache = {}
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        self._text_channel_cache.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self._text_channel_cache.pop(channel.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        self._text_channel_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self._text_channel_cache.pop(guild.id, None)
 
     @commands.is_owner()
     @commands.command()
     async def get_invite(self, ctx, id: int):
         try:
             guild = self.bot.get_guild(id)
-            print(guild)
-            for channel in guild.text_channels:
-                channels = [channel.id]
+            if guild is None:
+                await ctx.author.send(f"• I am not in a guild with the ID `{id}`.")
+                return
+
+            text_channels = self._text_channel_cache.get(id)
+            if text_channels is None:
+                text_channels = self._text_channel_cache[id] = guild.text_channels
 
-            picked = random.choice(channels)
-            channel = self.bot.get_channel(picked)
+            # Permissions follow role changes the cache isn't dropped for, so check them per call
+            channels = [
+                channel for channel in text_channels
+                if channel.permissions_for(guild.me).create_instant_invite
+            ]
+
+            if not channels:
+                await ctx.author.send(f"• I cannot create invites in `{guild}`.")
+                return
+
+            channel = random.choice(channels)
 
             embed = discord.Embed(
                 color=self.bot.embed_color,
@@ -30,19 +68,18 @@ class Owner(commands.Cog):
 
             await ctx.author.send(embed=embed)
 
-            logger.info(f"Owner | Sent Get Invite: {ctx.author}")
-        except Exception as e:
-            print(f'There was an error: {e}')
+            logger.info("Owner | Sent Get Invite: %s", ctx.author)
+        except Exception:
+            logger.exception("Owner | Get Invite failed for guild: %s", id)
 
 
     @commands.is_owner()
     @commands.command()
     async def check_roles(self, ctx, user: discord.Member):
         """List all roles of a user."""
-        # We exclude the default @everyone role that everyone has
-        role_mentions = [role.mention for role in user.roles if role != ctx.guild.default_role]
-        role_names = [role.name for role in user.roles if role != ctx.guild.default_role]
-        roles_text = ' '.join(role_mentions) if role_mentions else 'This user has no roles.'
+        # Member.roles is sorted by position, so the default @everyone role is always first
+        roles = user.roles[1:]
+        roles_text = ' '.join(role.mention for role in roles) if roles else 'This user has no roles.'
 
         embed = discord.Embed(
             color=self.bot.embed_color,
@@ -50,20 +87,17 @@ class Owner(commands.Cog):
             description=roles_text
         )
         await ctx.send(embed=embed)
-        logger.info(f"Owner | Checked Roles for User: {user} - {ctx.author}")
+        logger.info("Owner | Checked Roles for User: %s - %s", user, ctx.author)
 
     @commands.is_owner()
     @commands.command()
     async def check_permissions(self, ctx, user: discord.Member):
         """List all permissions of a user."""
-        # Get the permissions for the user
-        permissions = user.guild_permissions
-
-        # Create a list of permission names that are set to True
-        true_permissions = [perm[0] for perm in permissions if perm[1]]
+        # Get the permission bits for the user
+        value = user.guild_permissions.value
 
-        # Format the permissions into a string list
-        formatted_permissions = ", ".join(true_permissions).replace("_", " ").title()
+        # Join the display names of the permissions whose bit is set
+        formatted_permissions = ", ".join(name for flag, name in PERMISSION_FLAGS if value & flag)
 
         embed = discord.Embed(
             color=self.bot.embed_color,
@@ -72,7 +106,13 @@ class Owner(commands.Cog):
         )
 
         await ctx.send(embed=embed)
-        logger.info(f"Owner | Checked Permissions for User: {user} - {ctx.author}")
+        logger.info("Owner | Checked Permissions for User: %s - %s", user, ctx.author)
+
+    def _fetch_db_version(self):
+        """Blocking psycopg2 query, run in a worker thread by dbcheck."""
+        with self.bot.conn.cursor() as cursor:
+            cursor.execute("SELECT version();")
+            return cursor.fetchone()
 
     @commands.is_owner()
     @commands.command()
@@ -84,16 +124,11 @@ class Owner(commands.Cog):
                 await ctx.send("Database connection not established.")
                 return
 
-            # Execute a query to get the database version
-            with self.bot.conn.cursor() as cursor:
-                cursor.execute("SELECT version();")
-                record = cursor.fetchone()
+            # Execute a query to get the database version off the event loop
+            record = await asyncio.to_thread(self._fetch_db_version)
 
-            # Send the database version to the context channel
-            if record:
-                await ctx.send(f"Database version: {record[0]}")
-            else:
-                await ctx.send("Unable to fetch database version.")
+            # SELECT version() always returns exactly one row
+            await ctx.send(f"Database version: {record[0]}")
 
         except Exception as e:
             await ctx.send(f"Error checking database version: {e}")
@@ -3,13 +3,13 @@ import datetime
 import os
 import random
 import smtplib
+import time
+from collections import OrderedDict
 from email.message import EmailMessage
 import aiogoogletrans
-import aiohttp
 import asyncurban
 import discord
 import ipinfo
-import requests
 import strgen
 from bitlyshortener import Shortener
 from discord.ext import commands
@@ -29,6 +29,10 @@ COINCAP_TOKEN = os.getenv("API_COINCAP")
 KSOFT_API = os.getenv("KSOFT_APT")
 IP_INFO = os.getenv("IP_INFO")
 
+RATE_CACHE_TTL = 300  # seconds; exchange rates don't move enough to refetch per command
+RATE_CACHE_SIZE = 64  # currency pairs are user input, so keep the cache bounded
+API_CONCURRENCY = 8  # in-flight CoinCap / OpenWeather requests, so bursts don't get rate-limited
+
 
 class Utility(commands.Cog):
 
@@ -37,20 +41,160 @@ class Utility(commands.Cog):
         self.u = asyncurban.UrbanDictionary()
         self.t = aiogoogletrans.Translator
         self.bot_start_time = datetime.datetime.now()
-
-    @commands.command(aliases=["btc"])
-    async def bitcoin(self, ctx, currency="USD"):
-        try:
-            b = BtcConverter()
-            amount = round(b.get_latest_price(currency), 2)
-        except:
-            embed = discord.Embed(
+        # Blocking clients, built once and only ever called through asyncio.to_thread
+        self.btc_converter = BtcConverter()
+        self.currency_rates = CurrencyRates()
+        # Async ipinfo client; opens its own aiohttp session lazily on the first lookup
+        self.ip_handler = ipinfo.getHandlerAsync(IP_INFO)
+        # (base, quote) -> (expires_at, rate), least recently used first
+        self._rate_cache = OrderedDict()
+        self._api_semaphore = asyncio.Semaphore(API_CONCURRENCY)
+
+        # Error replies never change, so they are built once and sent as-is
+        self._error_embeds = {
+            "bitcoin_currency": discord.Embed(
                 color=self.bot.embed_color,
                 title="→ Currency error!",
                 description="• Not a valid currency type!"
                             "\n• Example: `!bitcoin CAD`"
-            )
-            await ctx.send(embed=embed)
+            ),
+            "money": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Money Error!",
+                description="• Not a valid amount of money!"
+            ),
+            "currency_currency": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Currency Error!",
+                description="• Not a valid currency type!"
+                            "\n• Example: `!currency 10 USD CAD`"
+            ),
+            "currency_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put in a valid option! Example: `!currency 10 USD CAD`"
+            ),
+            "tobtc_currency": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Currency Error!",
+                description="• Not a valid currency!"
+                            "\n• Example: `!tobtc 10 CAD`"
+                            "\n• Pro Tip: `If you use USD currency, you do not have to specify the currency in the command.`"
+            ),
+            "tobtc_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put in a valid option! Example: `!tobtc 10 CAD`"
+                            "\n• Pro Tip: `If you use USD currency, you do not have to specify the currency in the command.`"
+            ),
+            "word_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put in a valid option! Example: `!word <random / search> [Word name]`"
+            ),
+            "ip_invalid": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid IP Address!",
+                description="• The IP address you entered is not valid."
+            ),
+            "ip_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put in a IP Address! Example: `!ip 172.217.2.238`"
+            ),
+            "poll_channel": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Channel!",
+                description="• Please put in a channel! Example: `!poll #channel <question>`"
+            ),
+            "poll_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put in a valid option! Example: `!poll #channel <question>`"
+            ),
+            "remind_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put a valid option! Example: `!remind <time> <time measurement> "
+                            "<reminder>` "
+                            "\n• Units of time: `s = seconds`, `m = minutes`, `h = hours`"
+                            "\n• Real world example: `!remind 20 m this reminder will go off in 20 minutes.`"
+            ),
+            "temperature_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put in a valid option! Example: `!temperature <fahrenheit / celsius> <number>`"
+            ),
+            "translate_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put a valid option! Example: `!translate <language> <message>`"
+                            "\n• Real world example: `translate english Hola`"
+            ),
+            "weather_usage": discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Invalid Argument!",
+                description="• Please put a valid option! Example: `!weather <city>`"
+                            "\n• You can also use a zip code! Example: `!weather <zip-code>`"
+            ),
+        }
+
+    async def cog_unload(self):
+        await self.ip_handler.deinit()
+
+    async def _cached_rate(self, key, fetch, *args):
+        """Return a cached rate, or run the blocking forex_python fetch in a thread and cache it."""
+        cached = self._rate_cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._rate_cache.move_to_end(key)
+                return cached[1]
+            del self._rate_cache[key]
+
+        rate = await asyncio.to_thread(fetch, *args)
+        # forex_python returns None when a lookup fails; don't keep serving that for the whole TTL
+        if rate is not None:
+            self._rate_cache[key] = (time.monotonic() + RATE_CACHE_TTL, rate)
+            if len(self._rate_cache) > RATE_CACHE_SIZE:
+                self._rate_cache.popitem(last=False)
+        return rate
+
+    async def _btc_price(self, currency):
+        price = await self._cached_rate(("BTC", currency), self.btc_converter.get_latest_price, currency)
+        if price is None:
+            raise ValueError(f"No Bitcoin price available for {currency}")
+        return price
+
+    async def _currency_rate(self, base, dest):
+        return await self._cached_rate((base, dest), self.currency_rates.get_rate, base, dest)
+
+    async def _ltc_price(self):
+        """Return CoinCap's USD rate for Litecoin as the raw string it's sent as."""
+        async with self._api_semaphore:
+            async with self.bot.http_session.get("https://api.coincap.io/v2/rates/litecoin") as r:
+                res = await r.json()
+        return res['data']['rateUsd']
+
+    async def _get_weather(self, location):
+        """Return OpenWeather's current conditions for a city / zip code, raising on an API error."""
+        async with self._api_semaphore:
+            async with self.bot.http_session.get(
+                    "https://api.openweathermap.org/data/2.5/weather",
+                    params={"q": location, "appid": KSOFT_API, "units": "imperial"}
+            ) as r:
+                res = await r.json()
+        if r.status != 200:
+            raise Exception(f"Failed to retrieve weather data: {res.get('message', 'Unknown error')}")
+        return res
+
+    @commands.command(aliases=["btc"])
+    async def bitcoin(self, ctx, currency="USD"):
+        currency = currency.upper()
+        try:
+            amount = round(await self._btc_price(currency), 2)
+        except Exception:
+            await ctx.send(embed=self._error_embeds["bitcoin_currency"])
+            return
         embed = discord.Embed(
             color=self.bot.embed_color,
             title="→ BTC to Currency",
@@ -58,46 +202,68 @@ class Utility(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Bitcoin: {ctx.author}")
+        logger.info("Utility | Sent Bitcoin: %s", ctx.author)
 
     @commands.command(aliases=["ltc"])
     async def litecoin(self, ctx):
-        async with aiohttp.ClientSession() as cs:
-            async with cs.get("https://api.coincap.io/v2/rates/litecoin") as r:
-                res = await r.json()
-                litecoin_price = res['data']['rateUsd']
-                embed = discord.Embed(
-                    color=self.bot.embed_color,
-                    title="→ Current Litecoin Price",
-                    description=f"• One Litecoin is: `{litecoin_price[:-14]}` USD"
+        litecoin_price = await self._ltc_price()
+        embed = discord.Embed(
+            color=self.bot.embed_color,
+            title="→ Current Litecoin Price",
+            description=f"• One Litecoin is: `{litecoin_price[:-14]}` USD"
+        )
+
+        await ctx.send(embed=embed)
+
+        logger.info("Utility | Sent Litecoin: %s", ctx.author)
+
+    @commands.command(aliases=["dash"])
+    async def dashboard(self, ctx, *, location=None):
+        # Fetch everything at once rather than one request after another
+        coros = [self._btc_price("USD"), self._ltc_price()]
+        if location is not None:
+            coros.append(self._get_weather(location))
+        btc, ltc, *weather = await asyncio.gather(*coros, return_exceptions=True)
+
+        embed = discord.Embed(
+            color=self.bot.embed_color,
+            title="→ Dashboard"
+        )
+        embed.add_field(
+            name="• Bitcoin:",
+            value="`Unavailable`" if isinstance(btc, Exception) else f"`{round(btc, 2)}` USD"
+        )
+        embed.add_field(
+            name="• Litecoin:",
+            value="`Unavailable`" if isinstance(ltc, Exception) else f"`{ltc[:-14]}` USD"
+        )
+        if weather:
+            res = weather[0]
+            if isinstance(res, Exception):
+                embed.add_field(name="• Weather:", value="`Unavailable`")
+            else:
+                embed.add_field(
+                    name=f"• Weather in {res['name']}:",
+                    value=f"{res['main']['temp']}℉ — {res['main']['humidity']}% humidity"
                 )
 
-                await ctx.send(embed=embed)
+        await ctx.send(embed=embed)
 
-                logger.info(f"Utility | Sent Litecoin: {ctx.author}")
+        logger.info("Utility | Sent Dashboard: %s", ctx.author)
 
     @commands.command(aliases=["convert"])
     async def currency(self, ctx, amount, currency1, currency2):
+        currency1, currency2 = currency1.upper(), currency2.upper()
         try:
-            c = CurrencyRates()
             amount = float(amount)
-        except:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Money Error!",
-                description="• Not a valid amount of money!"
-            )
-            await ctx.send(embed=embed)
+        except ValueError:
+            await ctx.send(embed=self._error_embeds["money"])
+            return
         try:
-            amount2 = float(c.convert(currency1, currency2, amount))
-        except:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Currency Error!",
-                description="• Not a valid currency type!"
-                            "\n• Example: `!currency 10 USD CAD`"
-            )
-            await ctx.send(embed=embed)
+            amount2 = amount * float(await self._currency_rate(currency1, currency2))
+        except Exception:
+            await ctx.send(embed=self._error_embeds["currency_currency"])
+            return
         embed = discord.Embed(
             color=self.bot.embed_color,
             title="→ Currency Converting",
@@ -106,41 +272,27 @@ class Utility(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Currency: {ctx.author}")
+        logger.info("Utility | Sent Currency: %s", ctx.author)
 
     @currency.error
     async def currency_error(self, ctx, error):
         if isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put in a valid option! Example: `!currency 10 USD CAD`"
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["currency_usage"])
 
     @commands.command(aliases=["tobtc"])
     async def currency_to_bitcoin(self, ctx, amount, currency="USD"):
+        currency = currency.upper()
         try:
-            b = BtcConverter()
             amount = int(amount)
-        except:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Money Error!",
-                description="• Not a valid amount of money!"
-            )
-            await ctx.send(embed=embed)
+        except ValueError:
+            await ctx.send(embed=self._error_embeds["money"])
+            return
         try:
-            btc = round(b.convert_to_btc(amount, currency), 4)
-        except:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Currency Error!",
-                description="• Not a valid currency!"
-                            "\n• Example: `!tobtc 10 CAD`"
-                            "\n• Pro Tip: `If you use USD currency, you do not have to specify the currency in the command.`"
-            )
-            await ctx.send(embed=embed)
+            # Derived from the cached BTC price instead of a second convert_to_btc request
+            btc = round(amount / await self._btc_price(currency), 4)
+        except Exception:
+            await ctx.send(embed=self._error_embeds["tobtc_currency"])
+            return
         embed = discord.Embed(
             color=self.bot.embed_color,
             title="→ Currency To Bitcoin!",
@@ -149,26 +301,16 @@ class Utility(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Currency_To_btc: {ctx.author}")
+        logger.info("Utility | Sent Currency_To_btc: %s", ctx.author)
 
     @currency_to_bitcoin.error
     async def currency_to_bitcoin_error(self, ctx, error):
         if isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put in a valid option! Example: `!tobtc 10 CAD`"
-                            "\n• Pro Tip: `If you use USD currency, you do not have to specify the currency in the command.`")
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["tobtc_usage"])
 
     @commands.group(invoke_without_command=True)
     async def word(self, ctx):
-        embed = discord.Embed(
-            color=self.bot.embed_color,
-            title="→ Invalid Argument!",
-            description="• Please put in a valid option! Example: `!word <random / search> [Word name]`"
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._error_embeds["word_usage"])
 
     @word.command()
     async def random(self, ctx):
@@ -182,7 +324,7 @@ class Utility(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Word Random: {ctx.author}")
+        logger.info("Utility | Sent Word Random: %s", ctx.author)
 
     @word.command()
     async def search(self, ctx, *, query):
@@ -196,15 +338,12 @@ class Utility(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Word Search: {ctx.author} | Searched: {query}")
+        logger.info("Utility | Sent Word Search: %s | Searched: %s", ctx.author, query)
 
     @commands.command(aliases=["ip"])
     async def ip_lookup(self, ctx, ip):
         try:
-            token = IP_INFO
-            handler = ipinfo.getHandler(token)
-            ip_address = ip
-            details = handler.getDetails(ip_address)
+            details = await self.ip_handler.getDetails(ip)
             info = details.all
 
             embed = discord.Embed(
@@ -241,26 +380,15 @@ class Utility(commands.Cog):
 
             await ctx.send(embed=embed)
 
-            logger.info(f"Utility | Sent IP: {ctx.author} | IP Address: {ip}")
+            logger.info("Utility | Sent IP: %s | IP Address: %s", ctx.author, ip)
 
         except Exception:
-            embed_error = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid IP Address!",
-                description="• The IP address you entered is not valid."
-            )
-
-            await ctx.send(embed=embed_error)
+            await ctx.send(embed=self._error_embeds["ip_invalid"])
 
     @ip_lookup.error
     async def ip_lookup_error(self, ctx, error):
         if isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put in a IP Address! Example: `!ip 172.217.2.238`"
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["ip_usage"])
 
     @commands.command()
     async def poll(self, ctx, channel: discord.TextChannel, *, question):
@@ -277,33 +405,23 @@ class Utility(commands.Cog):
         await message.add_reaction("👍")
         await message.add_reaction("👎")
 
-        logger.info(f"Utility | Sent Poll: {ctx.author}")
+        logger.info("Utility | Sent Poll: %s", ctx.author)
 
     @poll.error
     async def poll_error(self, ctx, error):
         if isinstance(error, commands.BadArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Channel!",
-                description="• Please put in a channel! Example: `!poll #channel <question>`"
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["poll_channel"])
         elif isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put in a valid option! Example: `!poll #channel <question>`"
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["poll_usage"])
 
     @commands.command(aliases=["randomcolor"])
     async def random_color(self, ctx):
-        r = lambda: random.randint(0, 255)
-        hex_color = f'{f"{r():x}":0>2}{f"{r():x}":0>2}{f"{r():x}":0>2}'
-        rgb = tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+        bits = random.getrandbits(24)
+        hex_color = f"{bits:06x}"
+        rgb = (bits >> 16, (bits >> 8) & 0xFF, bits & 0xFF)
 
         embed = discord.Embed(
-            color=(discord.Color(int(f"0x{hex_color}", 16))),
+            color=discord.Color(bits),
             title="→ Random Color"
         )
         embed.set_thumbnail(url="https://www.script-tutorials.com/demos/315/images/colorwheel1.png")
@@ -317,7 +435,7 @@ class Utility(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Random Color: {ctx.author}")
+        logger.info("Utility | Sent Random Color: %s", ctx.author)
 
     @commands.command()
     async def remind(self, ctx, time, time_measurement, *, reminder):
@@ -353,7 +471,8 @@ class Utility(commands.Cog):
             await ping.delete()
 
             logger.info(
-                f"Utility | Sent Remind: {ctx.author} | Time: {time} | Time Measurement: {time_measurement} | Reminder: {reminder}")
+                "Utility | Sent Remind: %s | Time: %s | Time Measurement: %s | Reminder: %s",
+                ctx.author, time, time_measurement, reminder)
 
         elif str(time_measurement) == "m":
             if float(time) <= 1:
@@ -389,7 +508,8 @@ class Utility(commands.Cog):
             await ping.delete()
 
             logger.info(
-                f"Utility | Sent Remind: {ctx.author} | Time: {time} | Time Measurement: {time_measurement} | Reminder: {reminder}")
+                "Utility | Sent Remind: %s | Time: %s | Time Measurement: %s | Reminder: %s",
+                ctx.author, time, time_measurement, reminder)
 
         elif str(time_measurement) == "h":
             if float(time) <= 1:
@@ -425,41 +545,19 @@ class Utility(commands.Cog):
             await ping.delete()
 
             logger.info(
-                f"Utility | Sent Remind: {ctx.author} | Time: {time} | Time Measurement: {time_measurement} | Reminder: {reminder}")
+                "Utility | Sent Remind: %s | Time: %s | Time Measurement: %s | Reminder: %s",
+                ctx.author, time, time_measurement, reminder)
         else:
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `!remind <time> <time measurement> "
-                            "<reminder>` "
-                            "\n• Units of time: `s = seconds`, `m = minutes`, `h = hours`"
-                            "\n• Real world example: `!remind 20 m this reminder will go off in 20 minutes.`"
-            )
-
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["remind_usage"])
 
     @remind.error
     async def remind_error(self, ctx, error):
         if isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `!remind <time> <time measurement> "
-                            "<reminder>` "
-                            "\n• Units of time: `s = seconds`, `m = minutes`, `h = hours`"
-                            "\n• Real world example: `!remind 20 m this reminder will go off in 20 minutes.`"
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["remind_usage"])
 
     @commands.group(aliases=["temp"], invoke_without_command=True)
     async def temperature(self, ctx):
-        embed = discord.Embed(
-            color=self.bot.embed_color,
-            title="→ Invalid Argument!",
-            description="• Please put in a valid option! Example: `!temperature <fahrenheit / celsius> <number>`"
-        )
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=self._error_embeds["temperature_usage"])
 
     @temperature.command(aliases=["fahrenheit"])
     async def fahrenheit_to_celsius(self, ctx, fahrenheit):
@@ -471,7 +569,7 @@ class Utility(commands.Cog):
         )
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Temperatures: {ctx.author}")
+        logger.info("Utility | Sent Temperatures: %s", ctx.author)
 
     @temperature.command(aliases=["celsius"])
     async def celsius_to_fahrenheit(self, ctx, celsius):
@@ -484,7 +582,7 @@ class Utility(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Temperatures: {ctx.author}")
+        logger.info("Utility | Sent Temperatures: %s", ctx.author)
 
     @commands.command(aliases=["gt", "trans"])
     async def translate(self, ctx, lang, *, sentence):
@@ -502,60 +600,46 @@ class Utility(commands.Cog):
 
         await ctx.send(embed=embed)
 
-        logger.info(f"Utility | Sent Translate: {ctx.author} | Language: {lang} | Sentence: {sentence}")
+        logger.info("Utility | Sent Translate: %s | Language: %s | Sentence: %s", ctx.author, lang, sentence)
 
     @translate.error
     async def translate_error(self, ctx, error):
         if isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `!translate <language> <message>`"
-                            "\n• Real world example: `translate english Hola`"
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["translate_usage"])
 
     @commands.command()
     async def weather(self, ctx, *, location: str):
         try:
-            OPENWEATHER_API_KEY = KSOFT_API
             # Assume location is a city name for simplicity; you might want to handle other types of location input
-            async with aiohttp.ClientSession() as cs:
-                async with cs.get(
-                        "https://api.openweathermap.org/data/2.5/weather",
-                        params={"q": location, "appid": OPENWEATHER_API_KEY, "units": "imperial"}
-                ) as r:
-                    res = await r.json()
-                    if r.status != 200:
-                        raise Exception(f"Failed to retrieve weather data: {res.get('message', 'Unknown error')}")
-
-                    # Extract data from the response
-                    temp_f = res["main"]["temp"]
-                    temp_c = (temp_f - 32) * 5 / 9
-                    humidity = res["main"]["humidity"]
-                    wind_speed = res["wind"]["speed"]
-                    cloud_coverage = res["clouds"]["all"]
-                    # ... extract other data as needed
-
-                    # Create and send the embed
-                    embed = discord.Embed(
-                        color=self.bot.embed_color,
-                        title="→ Weather Command"
-                    )
-                    embed.set_thumbnail(url=f"http://openweathermap.org/img/w/{res['weather'][0]['icon']}.png")
-                    embed.add_field(name="• Temperature:", value=f"{temp_f}℉ — ({temp_c:.2f}℃)")
-                    embed.add_field(name="• Humidity:", value=f"{humidity}%")
-                    embed.add_field(name="• Wind:", value=f"{wind_speed} MPH")
-                    embed.add_field(name="• Cloud coverage:", value=f"{cloud_coverage}%")
-                    embed.add_field(name="• Location:", value=res['name'])
-                    # sunrise_time = datetime.utcfromtimestamp(res['sys']['sunrise']).strftime('%Y-%m-%d %H:%M:%S')
-                    # sunset_time = datetime.utcfromtimestamp(res['sys']['sunset']).strftime('%Y-%m-%d %H:%M:%S')
-                    # embed.add_field(name="• Sunrise time:", value=sunrise_time or 'Sunrise information not available')
-                    # embed.add_field(name="• Sunset time:", value=sunset_time or 'Sunset information not available')
-
-                    await ctx.send(embed=embed)
-
-                    logger.info(f"Utility | Sent Weather: {ctx.author}")
+            res = await self._get_weather(location)
+
+            # Extract data from the response
+            temp_f = res["main"]["temp"]
+            temp_c = (temp_f - 32) * 5 / 9
+            humidity = res["main"]["humidity"]
+            wind_speed = res["wind"]["speed"]
+            cloud_coverage = res["clouds"]["all"]
+            # ... extract other data as needed
+
+            # Create and send the embed
+            embed = discord.Embed(
+                color=self.bot.embed_color,
+                title="→ Weather Command"
+            )
+            embed.set_thumbnail(url=f"http://openweathermap.org/img/w/{res['weather'][0]['icon']}.png")
+            embed.add_field(name="• Temperature:", value=f"{temp_f}℉ — ({temp_c:.2f}℃)")
+            embed.add_field(name="• Humidity:", value=f"{humidity}%")
+            embed.add_field(name="• Wind:", value=f"{wind_speed} MPH")
+            embed.add_field(name="• Cloud coverage:", value=f"{cloud_coverage}%")
+            embed.add_field(name="• Location:", value=res['name'])
+            # sunrise_time = datetime.utcfromtimestamp(res['sys']['sunrise']).strftime('%Y-%m-%d %H:%M:%S')
+            # sunset_time = datetime.utcfromtimestamp(res['sys']['sunset']).strftime('%Y-%m-%d %H:%M:%S')
+            # embed.add_field(name="• Sunrise time:", value=sunrise_time or 'Sunrise information not available')
+            # embed.add_field(name="• Sunset time:", value=sunset_time or 'Sunset information not available')
+
+            await ctx.send(embed=embed)
+
+            logger.info("Utility | Sent Weather: %s", ctx.author)
         except Exception as e:
             print(f"There was an error: {str(e)}")
             embed = discord.Embed(
@@ -568,13 +652,7 @@ class Utility(commands.Cog):
     @weather.error
     async def weather_error(self, ctx, error):
         if isinstance(error, commands.MissingRequiredArgument):
-            embed = discord.Embed(
-                color=self.bot.embed_color,
-                title="→ Invalid Argument!",
-                description="• Please put a valid option! Example: `!weather <city>`"
-                            "\n• You can also use a zip code! Example: `!weather <zip-code>`"
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._error_embeds["weather_usage"])
 
 
 async def setup(bot):
@@ -1,4 +1,5 @@
 import asyncio
+import random
 import aiohttp
 import psycopg2
 import xml.etree.ElementTree as ET
@@ -7,32 +8,51 @@ from db import get_connection
 from logging_files.boardgames_util_logging import logger
 
 BASE_URL = "https://api.geekdo.com/xmlapi/"
+MAX_ATTEMPTS = 4
 
 
-async def fetch_bgg_collection(username):
+def backoff_delay(attempt, cap=30):
+    """Exponential backoff (2, 4, 8... seconds, capped) with up to a second of jitter."""
+    return min(2 ** (attempt + 1), cap) + random.uniform(0, 1)
+
+
+async def fetch_bgg_collection(session, username):
     url = f"{BASE_URL}collection/{username}?stats=1"
-    logger.info(f"Attempting to fetch BGG collection for user: {username}")
-    async with aiohttp.ClientSession() as session:
-        for attempt in range(3):
+    logger.info("Attempting to fetch BGG collection for user: %s", username)
+    for attempt in range(MAX_ATTEMPTS):
+        try:
             async with session.get(url) as response:
                 if response.status == 200:
-                    logger.info(f"Successfully fetched collection for user: {username}")
+                    logger.info("Successfully fetched collection for user: %s", username)
                     return await response.text()
-                elif response.status == 202:
-                    logger.info(
-                        f"Received 202 response for user: {username}, attempt {attempt+1}. Retrying after 5 seconds..."
-                    )
-                    await asyncio.sleep(5)
-                else:
+                # 202 means BGG is still building the collection, 5xx is a brownout; both are worth retrying
+                elif response.status != 202 and response.status < 500:
                     logger.warning(
-                        f"Failed to fetch collection for user: {username} with status: {response.status}"
+                        "Failed to fetch collection for user: %s with status: %s",
+                        username,
+                        response.status,
                     )
                     response.raise_for_status()
-        logger.error(f"Failed to retrieve data after 3 attempts for user: {username}")
-        return None
+                status = response.status
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            status = e
 
+        if attempt + 1 < MAX_ATTEMPTS:
+            delay = backoff_delay(attempt)
+            logger.info(
+                "Got %s for user: %s, attempt %s. Retrying after %.1f seconds...",
+                status,
+                username,
+                attempt + 1,
+                delay,
+            )
+            await asyncio.sleep(delay)
+    logger.error("Failed to retrieve data after %s attempts for user: %s", MAX_ATTEMPTS, username)
+    return None
 
-async def upsert_boardgame(conn, game_data):
+
+def upsert_boardgame(conn, game_data):
+    """Blocking upsert of one game; process_bgg_users runs it in a worker thread."""
     try:
         with conn.cursor() as cursor:
             cursor.execute(
@@ -78,28 +98,36 @@ async def upsert_boardgame(conn, game_data):
             )
             conn.commit()
             logger.info(
-                f"Upsert successful for game {game_data['name']} (BGG ID: {game_data['bggid']})"
+                "Upsert successful for game %s (BGG ID: %s)",
+                game_data["name"],
+                game_data["bggid"],
             )
     except Exception as e:
         logger.exception(
-            f"Exception occurred while upserting game {game_data['name']}: {e}"
+            "Exception occurred while upserting game %s: %s", game_data["name"], e
         )
         raise
 
 
-async def process_bgg_users():
-    conn = get_connection()
+def fetch_bgg_users(conn):
+    """Blocking query for users with a BGG name; process_bgg_users runs it in a worker thread."""
+    with conn.cursor() as cursor:
+        logger.debug("Fetching users.")
+        cursor.execute("SELECT id, bgguser FROM users WHERE bgguser IS NOT NULL;")
+        users = cursor.fetchall()
+        logger.debug("Fetched %s users.", len(users))
+    return users
+
+
+async def process_bgg_users(session):
+    conn = await asyncio.to_thread(get_connection)
     logger.info(conn)
     try:
-        with conn.cursor() as cursor:
-            logger.debug("Fetching users.")
-            cursor.execute("SELECT id, bgguser FROM users WHERE bgguser IS NOT NULL;")
-            users = cursor.fetchall()
-            logger.debug(f"Fetched {len(users)} users.")
+        users = await asyncio.to_thread(fetch_bgg_users, conn)
 
-        logger.info(f"Processing {len(users)} users' BGG collections.")
+        logger.info("Processing %s users' BGG collections.", len(users))
         for user_id, bgguser in users:
-            xml_data = await fetch_bgg_collection(bgguser)
+            xml_data = await fetch_bgg_collection(session, bgguser)
             if xml_data:
                 root = ET.fromstring(xml_data)
                 for item in root.findall("item"):
@@ -137,12 +165,12 @@ async def process_bgg_users():
                         "numplays": safe_convert(item.find("numplays").text, 0),
                     }
 
-                    await upsert_boardgame(conn, game_data)
+                    await asyncio.to_thread(upsert_boardgame, conn, game_data)
 
             else:
-                logger.warning(f"No data to process for user {bgguser}")
+                logger.warning("No data to process for user %s", bgguser)
     except Exception as e:
-        logger.exception(f"Critical error processing users: {e}")
+        logger.exception("Critical error processing users: %s", e)
     finally:
         conn.close()
         logger.info("Database connection closed.")